@@ -1,14 +1,22 @@
 """monkeyfs: Transparent filesystem interception via monkey-patching."""
 
-from .base import FileInfo, FileMetadata, FileSystem
-from .context import current_fs, suspend
-from .isolated import IsolatedFS
-from .mount import MountFS
-from .patching import patch
-from .readonly import ReadOnlyFS
-from .virtual import VirtualFS
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import FileInfo, FileMetadata, FileSystem
+    from .cached import CachedFS
+    from .context import current_fs, suspend
+    from .isolated import IsolatedFS
+    from .mount import MountFS
+    from .patching import patch
+    from .readonly import ReadOnlyFS
+    from .virtual import VirtualFS
 
 __all__ = [
+    "CachedFS",
     "current_fs",
     "FileInfo",
     "FileMetadata",
@@ -20,3 +28,32 @@ __all__ = [
     "suspend",
     "VirtualFS",
 ]
+
+# Public names are resolved from their submodule on first access (PEP 562),
+# so ``import monkeyfs`` stays cheap until something is actually used.
+_LAZY = {
+    "CachedFS": "cached",
+    "current_fs": "context",
+    "FileInfo": "base",
+    "FileMetadata": "base",
+    "FileSystem": "base",
+    "IsolatedFS": "isolated",
+    "MountFS": "mount",
+    "patch": "patching",
+    "ReadOnlyFS": "readonly",
+    "suspend": "context",
+    "VirtualFS": "virtual",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
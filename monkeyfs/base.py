@@ -10,9 +10,31 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Protocol, runtime_checkable
 
+# Owner reported for virtual files. Looked up once at import rather than on
+# every stat; getuid/getgid are unavailable on Windows.
+_UID = os.getuid() if hasattr(os, "getuid") else 0
+_GID = os.getgid() if hasattr(os, "getgid") else 0
 
-@dataclass
-class FileMetadata:
+
+class _MetaCache:
+    """Slots for FileMetadata's derived values, kept out of its dataclass fields.
+
+    Timestamps are parsed lazily on first st_*time access since most callers
+    only need size/mode, and the os.stat_result for the patched os.stat() is
+    built on first use. FileMetadata is frozen, so these are filled in via
+    object.__setattr__.
+    """
+
+    __slots__ = ("_mode", "_mtime_ts", "_ctime_ts", "_stat_result")
+
+    _mode: int
+    _mtime_ts: float | None
+    _ctime_ts: float | None
+    _stat_result: os.stat_result | None
+
+
+@dataclass(slots=True, frozen=True)
+class FileMetadata(_MetaCache):
     """Metadata for a single file or directory.
 
     Attributes:
@@ -27,36 +49,38 @@ class FileMetadata:
     modified_at: str
     is_dir: bool = False
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_mode", 0o040755 if self.is_dir else 0o100644)
+        object.__setattr__(self, "_mtime_ts", None)
+        object.__setattr__(self, "_ctime_ts", None)
+        object.__setattr__(self, "_stat_result", None)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild through __init__ so pickles and copies carry only the
+        # fields and start with fresh caches
+        return (
+            type(self),
+            (self.size, self.created_at, self.modified_at, self.is_dir),
+        )
+
     # os.stat_result-compatible properties — allows FileMetadata to be
     # returned directly from stat() when used with sandtrap's os.stat() patch.
 
+    # Fields with a fixed value are plain class attributes rather than
+    # properties, so reading them doesn't cost a Python-level call.
+    st_ino = 0
+    st_dev = 0
+    st_nlink = 1
+    st_uid = _UID
+    st_gid = _GID
+
     @property
     def st_size(self) -> int:
         return self.size
 
     @property
     def st_mode(self) -> int:
-        return 0o040755 if self.is_dir else 0o100644
-
-    @property
-    def st_ino(self) -> int:
-        return 0
-
-    @property
-    def st_dev(self) -> int:
-        return 0
-
-    @property
-    def st_nlink(self) -> int:
-        return 1
-
-    @property
-    def st_uid(self) -> int:
-        return os.getuid() if hasattr(os, "getuid") else 0
-
-    @property
-    def st_gid(self) -> int:
-        return os.getgid() if hasattr(os, "getgid") else 0
+        return self._mode
 
     def _parse_ts(self, iso_str: str) -> float:
         try:
@@ -66,18 +90,42 @@ class FileMetadata:
 
     @property
     def st_atime(self) -> float:
-        return self._parse_ts(self.modified_at)
+        return self.st_mtime
 
     @property
     def st_mtime(self) -> float:
-        return self._parse_ts(self.modified_at)
+        if self._mtime_ts is None:
+            object.__setattr__(self, "_mtime_ts", self._parse_ts(self.modified_at))
+        return self._mtime_ts
 
     @property
     def st_ctime(self) -> float:
-        return self._parse_ts(self.created_at)
-
-
-@dataclass
+        if self._ctime_ts is None:
+            object.__setattr__(self, "_ctime_ts", self._parse_ts(self.created_at))
+        return self._ctime_ts
+
+    def _to_stat_result(self) -> os.stat_result:
+        """Return an equivalent os.stat_result, built once per instance."""
+        if self._stat_result is None:
+            result = os.stat_result(
+                (
+                    self.st_mode,
+                    self.st_ino,
+                    self.st_dev,
+                    self.st_nlink,
+                    self.st_uid,
+                    self.st_gid,
+                    self.st_size,
+                    self.st_atime,
+                    self.st_mtime,
+                    self.st_ctime,
+                )
+            )
+            object.__setattr__(self, "_stat_result", result)
+        return self._stat_result
+
+
+@dataclass(slots=True, frozen=True)
 class FileInfo:
     """Complete file information for UI display.
 
@@ -0,0 +1,217 @@
+"""Caching filesystem wrapper.
+
+Wraps any FileSystem and memoizes path lookups (stat, exists, isfile,
+isdir, realpath), including negative results. Mutations made through the wrapper
+drop the cache; other operations delegate transparently via __getattr__.
+"""
+
+from __future__ import annotations
+
+import stat
+import threading
+from collections import OrderedDict
+from typing import Any
+
+# Sentinel stored for paths whose stat() raised FileNotFoundError
+_MISSING = object()
+
+# Lookups that can be answered from an already cached stat() result
+_FROM_STAT = {
+    "exists": lambda st: True,
+    "isfile": lambda st: stat.S_ISREG(st.st_mode),
+    "isdir": lambda st: stat.S_ISDIR(st.st_mode),
+}
+
+
+class CachedFS:
+    """Wraps any FileSystem and caches stat/exists/isfile/isdir/realpath results.
+
+    Useful when code probes the same paths repeatedly — e.g. the import
+    system checking for ``__init__.py``/``.pyc`` candidates that don't
+    exist. Missing paths are cached too, so repeated probes return without
+    touching the wrapped filesystem, and an ``exists``/``isfile``/``isdir``
+    check on a path that was already ``stat()``-ed is answered from that
+    result.
+
+    Any mutating call made through the wrapper clears the cache. Changes
+    made to the wrapped filesystem directly are not seen until
+    ``invalidate()`` or ``clear_cache()`` is called, so the wrapper is best
+    scoped to a block of work:
+
+    Example:
+        >>> from monkeyfs import CachedFS, VirtualFS, patch
+        >>> vfs = VirtualFS({})
+        >>> with patch(CachedFS(vfs)):
+        ...     import some_module  # repeated probes hit the cache
+    """
+
+    def __init__(self, fs: Any, maxsize: int = 4096):
+        """Initialize the cache.
+
+        Args:
+            fs: Filesystem to wrap.
+            maxsize: Maximum number of cached lookups (least recently used
+                entries are evicted first).
+        """
+        self._fs = fs
+        self._maxsize = maxsize
+        self._cache: OrderedDict[tuple[str, str, str], Any] = OrderedDict()
+        # Guards the cache and _writers; held only around bookkeeping, never
+        # while calling into the wrapped filesystem. The generation counts
+        # clears, so a lookup that raced with a mutation isn't stored.
+        self._lock = threading.Lock()
+        self._generation = 0
+        # Files opened for writing through the wrapper. Their content (and
+        # so stat results) can change until they are closed, so lookups
+        # bypass the cache while any of them is still open.
+        self._writers: list[Any] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._fs, name)
+
+    # -- Cache management --
+
+    def invalidate(self, path: str) -> None:
+        """Drop cached lookups for a single path (as passed by the caller)."""
+        with self._lock:
+            for key in [k for k in self._cache if k[2] == path]:
+                del self._cache[key]
+            self._generation += 1
+
+    def clear_cache(self) -> None:
+        """Drop all cached lookups."""
+        with self._lock:
+            self._cache.clear()
+            self._generation += 1
+
+    def _lookup(self, method: str, path: str) -> Any:
+        if self._writers:
+            with self._lock:
+                writing = any(not f.closed for f in self._writers)
+                if not writing:
+                    self._writers.clear()
+                    self._cache.clear()
+                    self._generation += 1
+            if writing:
+                return getattr(self._fs, method)(path)
+
+        # Relative paths mean different things under different CWDs
+        cwd = self._fs.getcwd()
+        key = (method, cwd, path)
+        cache = self._cache
+        with self._lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            else:
+                # e.g. os.stat() followed by os.path.isfile() on the same path
+                derive = _FROM_STAT.get(method)
+                st = cache.get(("stat", cwd, path)) if derive is not None else None
+                if st is not None:
+                    value = False if st is _MISSING else derive(st)
+                    self._store(key, value)
+            generation = self._generation
+        if value is None:
+            try:
+                value = getattr(self._fs, method)(path)
+            except FileNotFoundError:
+                value = _MISSING
+            with self._lock:
+                if generation == self._generation:
+                    self._store(key, value)
+        if value is _MISSING:
+            raise FileNotFoundError(path)
+        return value
+
+    def _store(self, key: tuple[str, str, str], value: Any) -> None:
+        """Add an entry, evicting the oldest past maxsize. Needs _lock held."""
+        cache = self._cache
+        cache[key] = value
+        if len(cache) > self._maxsize:
+            cache.popitem(last=False)
+
+    # -- Cached lookups --
+
+    def stat(self, path: str) -> Any:
+        return self._lookup("stat", path)
+
+    def exists(self, path: str) -> bool:
+        return self._lookup("exists", path)
+
+    def isfile(self, path: str) -> bool:
+        return self._lookup("isfile", path)
+
+    def isdir(self, path: str) -> bool:
+        return self._lookup("isdir", path)
+
+    def realpath(self, path: str) -> str:
+        return self._lookup("realpath", path)
+
+    # -- Mutating operations (clear the cache) --
+
+    def _mutate(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Call a mutating method on the wrapped filesystem, then clear the cache.
+
+        Clearing afterwards (even on failure) also discards any lookup that
+        ran concurrently with the change.
+        """
+        try:
+            return getattr(self._fs, method)(*args, **kwargs)
+        finally:
+            self.clear_cache()
+
+    def open(self, path: str, mode: str = "r", **kwargs: Any) -> Any:
+        if not any(c in mode for c in "wax+"):
+            return self._fs.open(path, mode, **kwargs)
+        try:
+            f = self._fs.open(path, mode, **kwargs)
+            with self._lock:
+                self._writers.append(f)
+        finally:
+            self.clear_cache()
+        return f
+
+    def write(self, path: str, content: bytes, mode: str = "w") -> None:
+        self._mutate("write", path, content, mode=mode)
+
+    def write_many(self, files: dict[str, bytes]) -> None:
+        self._mutate("write_many", files)
+
+    def remove(self, path: str) -> None:
+        self._mutate("remove", path)
+
+    def remove_many(self, paths: list[str]) -> None:
+        self._mutate("remove_many", paths)
+
+    def mkdir(self, path: str, **kwargs: Any) -> None:
+        self._mutate("mkdir", path, **kwargs)
+
+    def makedirs(self, path: str, exist_ok: bool = True) -> None:
+        self._mutate("makedirs", path, exist_ok=exist_ok)
+
+    def rmdir(self, path: str) -> None:
+        self._mutate("rmdir", path)
+
+    def rename(self, src: str, dst: str) -> None:
+        self._mutate("rename", src, dst)
+
+    def replace(self, src: str, dst: str) -> None:
+        self._mutate("replace", src, dst)
+
+    def symlink(self, src: str, dst: str) -> None:
+        self._mutate("symlink", src, dst)
+
+    def link(self, src: str, dst: str) -> None:
+        self._mutate("link", src, dst)
+
+    def chmod(self, path: str, mode: int) -> None:
+        self._mutate("chmod", path, mode)
+
+    def chown(self, path: str, uid: int, gid: int) -> None:
+        self._mutate("chown", path, uid, gid)
+
+    def truncate(self, path: str, length: int) -> None:
+        self._mutate("truncate", path, length)
+
+    def utime(self, path: str, times: tuple[float, float] | None = None) -> None:
+        self._mutate("utime", path, times)
@@ -4,9 +4,10 @@ Shared context variables used by patching.py and filesystem implementations
 to coordinate filesystem routing and prevent recursion loops.
 """
 
+from __future__ import annotations
+
 import contextvars
-from contextlib import contextmanager
-from typing import Any, Iterator
+from typing import Any
 
 # Context variable holding the current filesystem
 current_fs: contextvars.ContextVar[Any] = contextvars.ContextVar(
@@ -14,16 +15,33 @@ current_fs: contextvars.ContextVar[Any] = contextvars.ContextVar(
 )
 
 
-@contextmanager
-def suspend() -> Iterator[None]:
+class _Suspend:
+    """Context manager returned by suspend().
+
+    A plain class rather than @contextmanager: it is entered around every
+    internal IsolatedFS operation, and skipping the generator machinery
+    keeps that cheap.
+    """
+
+    __slots__ = ("_token",)
+
+    def __enter__(self) -> None:
+        # Nothing to suspend — skip the set/reset (and its Token allocation)
+        if current_fs.get() is None:
+            self._token = None
+        else:
+            self._token = current_fs.set(None)
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._token is not None:
+            current_fs.reset(self._token)
+
+
+def suspend() -> _Suspend:
     """Temporarily disable filesystem interception in the current context.
 
     Use this when implementing internal filesystem operations (like inside
     IsolatedFS) that need to perform real I/O without triggering the
     patched functions recursively.
     """
-    token = current_fs.set(None)
-    try:
-        yield
-    finally:
-        current_fs.reset(token)
+    return _Suspend()
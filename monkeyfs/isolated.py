@@ -7,14 +7,36 @@ from __future__ import annotations
 
 import io
 import os
+import stat
 from datetime import datetime, timezone
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from .base import FileInfo, FileMetadata
 from .context import suspend
 
 
+def _iso_utc(ts: float) -> str:
+    """Format a POSIX timestamp as an ISO 8601 UTC string."""
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+def _climbs_out(cwd: str | None, path: str) -> bool:
+    """Lexically check whether path, relative to cwd (or root), leaves root."""
+    rel = os.path.join((cwd or "/").lstrip("/"), path)
+    return os.path.normpath(rel).split(os.sep, 1)[0] == ".."
+
+
+def _write_file(path: Path, content: bytes, mode: str) -> None:
+    """Write or append bytes to a host path."""
+    if mode == "a":
+        with path.open("ab") as f:
+            f.write(content)
+    else:
+        path.write_bytes(content)
+
+
 class IsolatedFS:
     """FileSystem interface restricted to a root directory.
 
@@ -48,7 +70,16 @@ class IsolatedFS:
             if not self.root.is_dir():
                 raise ValueError(f"Root must be a directory: {root}")
 
+        # String forms of root for the hot path in _validate_path()
+        self._root_str = str(self.root)
+        self._root_prefix = os.path.join(self._root_str, "")
+        # Directories this instance has created or confirmed, so writes into
+        # them can skip mkdir. Only a hint: a write whose parent has since
+        # disappeared recreates it (see _write_validated()).
+        self._known_dirs: set[Path] = {self.root}
         self._cwd = "/"
+        # CWD with a trailing slash, ready to prefix relative paths
+        self._cwd_prefix = "/"
 
     # -------------------------------------------------------------------------
     # Working Directory
@@ -72,11 +103,12 @@ class IsolatedFS:
             FileNotFoundError: If directory doesn't exist.
         """
         resolved_virtual = self.resolve_path(path)
-        real_path = self._validate_path(resolved_virtual)
         with suspend():
-            if not real_path.is_dir():
+            real_path = self._validate_path(resolved_virtual)
+            if not os.path.isdir(real_path):
                 raise FileNotFoundError(f"No such directory: '{path}'")
         self._cwd = "/" + resolved_virtual.lstrip("/") if resolved_virtual else "/"
+        self._cwd_prefix = os.path.join(self._cwd, "")
 
     def glob(self, pattern: str) -> list[str]:
         """Return list of paths matching a glob pattern."""
@@ -87,41 +119,60 @@ class IsolatedFS:
                 # e.g. /src/*.py -> root/src/*.py
                 search_path = self.root
                 search_pattern = pattern.lstrip("/")
+                cwd: str | None = None
             else:
                 # Relative pattern: relative to CWD
                 cwd = self.getcwd()  # e.g. /src
                 # e.g. root/src
-                search_path = self._validate_path(cwd.lstrip("/"))
+                search_path = self._validate_path(cwd)
                 search_pattern = pattern
 
             try:
-                # Use list to consume generator
-                matches = list(search_path.glob(search_pattern))
+                if (
+                    search_pattern
+                    and not search_pattern.endswith("/")
+                    and not any(c in search_pattern for c in "*?[")
+                ):
+                    # Literal pattern: a single existence check, no walk
+                    if _climbs_out(cwd, search_pattern):
+                        return []
+                    candidate = search_path / search_pattern
+                    matches: Iterable[Path] = (
+                        [candidate] if os.path.exists(candidate) else []
+                    )
+                else:
+                    # Descend through leading literal components directly so
+                    # Path.glob only matches the wildcard tail,
+                    # e.g. src/lib/*.py -> root/src/lib + *.py
+                    parts = search_pattern.split("/")
+                    for i, part in enumerate(parts):
+                        if any(c in part for c in "*?["):
+                            break
+                    else:
+                        i = 0
+                    if i:
+                        prefix = "/".join(parts[:i])
+                        # Relative to root rather than to search_path
+                        if _climbs_out(cwd, prefix):
+                            return []
+                        search_path = search_path / prefix
+                        search_pattern = "/".join(parts[i:])
+                    matches = search_path.glob(search_pattern)
 
                 # Convert matches back to virtual paths
+                # e.g. root/src/foo.py -> /src/foo.py, or foo.py relative to
+                # cwd=/src for relative patterns
+                prefix_len = 1 if cwd in (None, "/") else len(cwd) + 1
                 results = []
                 for m in matches:
-                    # m is absolute real path e.g. /tmp/root/src/foo.py
-                    # relative to root: src/foo.py
-                    rel = m.relative_to(self.root)
-                    virtual = "/" + str(rel)
-
-                    if not pattern.startswith("/"):
-                        # Convert absolute virtual to relative to CWD
-                        # e.g. /src/foo.py, cwd=/src -> foo.py
-                        cwd = self.getcwd()
-                        if virtual.startswith(cwd):
-                            if cwd == "/":
-                                results.append(virtual.lstrip("/"))
-                            else:
-                                results.append(virtual[len(cwd) + 1 :])
-                        else:
-                            # Fallback
-                            results.append(virtual)
+                    virtual = "/" + self._root_relative(str(m))
+                    if cwd is not None and virtual.startswith(cwd):
+                        results.append(virtual[prefix_len:])
                     else:
                         results.append(virtual)
 
-                return sorted(results)
+                results.sort()
+                return results
             except (OSError, ValueError):
                 return []
 
@@ -134,14 +185,17 @@ class IsolatedFS:
         Returns:
             Normalized absolute path (virtual, not host).
         """
-        if path.startswith("/"):
-            return os.path.normpath(path)
-        cwd = self.getcwd()
-        return os.path.normpath(f"{cwd}/{path}")
+        if not path.startswith("/"):
+            path = self._cwd_prefix + path
+        return os.path.normpath(path)
 
     def _validate_path(self, path: str | Path) -> Path:
         """Validate and resolve path to ensure it's within root.
 
+        Must be called inside suspend(): the real-filesystem lookups here
+        must not be routed back through an active patch. Public methods
+        enter suspend() once and validate inside it.
+
         Args:
             path: File path to validate (absolute or relative to CWD).
 
@@ -151,39 +205,45 @@ class IsolatedFS:
         Raises:
             PermissionError: If path escapes root directory.
         """
-        with suspend():
-            path_str = str(path)
+        path_str = str(path)
 
-            # For relative paths, prepend the CWD (but don't normalize yet)
-            # This preserves path traversal attempts for security validation
-            if not path_str.startswith("/"):
-                cwd = self.getcwd()
-                path_str = f"{cwd}/{path_str}"
+        # For relative paths, prepend the CWD (but don't normalize yet)
+        # This preserves path traversal attempts for security validation
+        if not path_str.startswith("/"):
+            path_str = self._cwd_prefix + path_str
 
-            p = Path(path_str)
+        # Treat virtual absolute paths as relative to the isolated root
+        # (chroot-like), e.g. /foo -> root/foo, / -> root. Paths already
+        # inside root (e.g. from resolve()) are used as is. This works on
+        # strings rather than Path objects since it runs on every call.
+        root = self._root_str
+        if path_str == root or path_str.startswith(self._root_prefix):
+            host = path_str
+        else:
+            host = os.path.join(root, path_str.lstrip("/"))
 
-            # Treat virtual absolute paths as relative to the isolated root (chroot-like)
-            # e.g. /foo -> root/foo, / -> root
-            if p.is_absolute():
-                # If path is already inside root (e.g. from resolve()), use it as is
-                try:
-                    p.relative_to(self.root)
-                    resolved = p.resolve()
-                except ValueError:
-                    # Virtual absolute path - treat as relative to root
-                    p = p.relative_to(p.anchor)
-                    resolved = (self.root / p).resolve()
-            else:
-                # Resolve relative to root (handles .., symlinks, etc.)
-                resolved = (self.root / p).resolve()
+        # Resolve against the real filesystem (handles .., symlinks, etc.)
+        resolved = os.path.realpath(host)
 
-            # Final boundary check
-            try:
-                resolved.relative_to(self.root)
-            except ValueError:
-                raise PermissionError(f"Path escapes sandbox: '{path_str}'")
+        # Final boundary check
+        if resolved != root and not resolved.startswith(self._root_prefix):
+            raise PermissionError(f"Path escapes sandbox: '{path_str}'")
+
+        return Path(resolved)
+
+    def _root_relative(self, host: str) -> str:
+        """Return a host path relative to root ("." for root itself).
 
-            return resolved
+        Like Path.relative_to(self.root) but on strings.
+
+        Raises:
+            ValueError: If host is not under root.
+        """
+        if host.startswith(self._root_prefix):
+            return host[len(self._root_prefix) :]
+        if host == self._root_str:
+            return "."
+        raise ValueError(f"{host!r} is not under {self._root_str!r}")
 
     def _validate_path_no_follow(self, path: str | Path) -> Path:
         """Validate path without following the final symlink component.
@@ -191,6 +251,7 @@ class IsolatedFS:
         Resolves the parent directory (following symlinks) to validate it's
         within root, but preserves the final path component unresolved.
         This is needed for symlink operations (readlink, islink, lexists).
+        Must be called inside suspend(), like _validate_path().
 
         Args:
             path: File path to validate.
@@ -201,35 +262,30 @@ class IsolatedFS:
         Raises:
             PermissionError: If path escapes root directory.
         """
-        with suspend():
-            path_str = str(path)
+        path_str = str(path)
 
-            # Resolve relative paths against CWD
-            if not path_str.startswith("/"):
-                cwd = self.getcwd()
-                path_str = f"{cwd}/{path_str}"
+        # Resolve relative paths against CWD
+        if not path_str.startswith("/"):
+            path_str = self._cwd_prefix + path_str
 
-            p = Path(path_str)
+        # Map virtual absolute path to host path, as in _validate_path()
+        root = self._root_str
+        if path_str == root or path_str.startswith(self._root_prefix):
+            host = path_str
+        else:
+            host = os.path.join(root, path_str.lstrip("/"))
 
-            # Map virtual absolute path to host path
-            if p.is_absolute():
-                try:
-                    p.relative_to(self.root)
-                    host_path = p
-                except ValueError:
-                    rel = p.relative_to(p.anchor)
-                    host_path = self.root / rel
-            else:
-                host_path = self.root / p
+        # Split off the final component the way Path does (empty and "."
+        # components are dropped, ".." is kept), without building Paths
+        parts = [part for part in host.split("/") if part and part != "."]
+        name = parts.pop() if parts else ""
 
-            # Resolve only the parent, keep the final component unresolved
-            parent_resolved = host_path.parent.resolve()
-            try:
-                parent_resolved.relative_to(self.root)
-            except ValueError:
-                raise PermissionError(f"Path escapes sandbox: '{path_str}'")
+        # Resolve only the parent, keep the final component unresolved
+        parent = os.path.realpath("/" + "/".join(parts))
+        if parent != root and not parent.startswith(self._root_prefix):
+            raise PermissionError(f"Path escapes sandbox: '{path_str}'")
 
-            return parent_resolved / host_path.name
+        return Path(os.path.join(parent, name))
 
     def open(self, path: str, mode: str = "r", **kwargs: Any) -> Any:
         """Open a file within the isolated filesystem.
@@ -265,39 +321,61 @@ class IsolatedFS:
             mode: Write mode ('w' for write, 'a' for append).
         """
         with suspend():
-            resolved = self._validate_path(path)
-            resolved.parent.mkdir(parents=True, exist_ok=True)
+            self._write_validated(self._validate_path(path), content, mode)
 
-            if mode == "a":
-                with resolved.open("ab") as f:
-                    f.write(content)
-            else:
-                resolved.write_bytes(content)
+    def _write_validated(self, resolved: Path, content: bytes, mode: str) -> None:
+        """Write to a validated path, creating its parent directory if needed.
+
+        Must be called inside suspend().
+        """
+        parent = resolved.parent
+        if parent in self._known_dirs:
+            try:
+                _write_file(resolved, content, mode)
+                return
+            except FileNotFoundError:
+                # Removed since we last saw it; recreate below
+                self._known_dirs.clear()
+        parent.mkdir(parents=True, exist_ok=True)
+        self._known_dirs.add(parent)
+        _write_file(resolved, content, mode)
+
+    @staticmethod
+    def _stat(resolved: Path) -> os.stat_result | None:
+        """Stat a validated path once, returning None if it doesn't exist.
+
+        Callers derive existence, type, size, and times from the one result
+        instead of issuing a separate syscall for each. Errors are treated
+        as "missing", matching os.path.exists()/isfile()/isdir().
+        """
+        try:
+            return os.stat(resolved)
+        except (OSError, ValueError):
+            return None
 
     def exists(self, path: str) -> bool:
         """Check if path exists."""
         with suspend():
-            resolved = self._validate_path(path)
-            return resolved.exists()
+            return self._stat(self._validate_path(path)) is not None
 
     def isfile(self, path: str) -> bool:
         """Check if path is a file."""
         with suspend():
-            resolved = self._validate_path(path)
-            return resolved.is_file()
+            st = self._stat(self._validate_path(path))
+            return st is not None and stat.S_ISREG(st.st_mode)
 
     def isdir(self, path: str) -> bool:
         """Check if path is a directory."""
         with suspend():
-            resolved = self._validate_path(path)
-            return resolved.is_dir()
+            st = self._stat(self._validate_path(path))
+            return st is not None and stat.S_ISDIR(st.st_mode)
 
     def islink(self, path: str) -> bool:
         """Check if path is a symbolic link."""
         with suspend():
             try:
                 unresolved = self._validate_path_no_follow(path)
-                return unresolved.is_symlink()
+                return os.path.islink(unresolved)
             except (PermissionError, FileNotFoundError):
                 return False
 
@@ -306,23 +384,28 @@ class IsolatedFS:
         with suspend():
             try:
                 unresolved = self._validate_path_no_follow(path)
-                return unresolved.exists() or unresolved.is_symlink()
+                # One lstat: a dangling link still exists as a link
+                return os.path.lexists(unresolved)
             except (PermissionError, FileNotFoundError):
                 return False
 
     def samefile(self, path1: str, path2: str) -> bool:
         """Check if two paths refer to the same file."""
         with suspend():
-            r1 = self._validate_path(path1)
-            r2 = self._validate_path(path2)
-            return r1.resolve() == r2.resolve()
+            # Paths are already resolved; compare device and inode like
+            # os.path.samefile(), so hard links match too
+            st1 = self._stat(self._validate_path(path1))
+            st2 = self._stat(self._validate_path(path2))
+        if st1 is None or st2 is None:
+            return False
+        return os.path.samestat(st1, st2)
 
     def realpath(self, path: str) -> str:
         """Return the canonical path."""
         with suspend():
             resolved = self._validate_path(path)
             # Return path relative to the root, as if root was /
-            return "/" + str(resolved.relative_to(self.root)).lstrip("/")
+            return "/" + self._root_relative(str(resolved)).lstrip("/")
 
     def list(self, path: str = ".", recursive: bool = False) -> list[str]:
         """List directory contents.
@@ -333,26 +416,102 @@ class IsolatedFS:
         """
         with suspend():
             resolved = self._validate_path(path)
-            if not resolved.exists():
-                raise FileNotFoundError(f"No such directory: '{path}'")
-            if not resolved.is_dir():
-                raise NotADirectoryError(f"Not a directory: '{path}'")
+            # Let the directory read itself report a missing path or a file,
+            # rather than stat-ing it twice up front
+            try:
+                names = os.listdir(resolved)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"No such directory: '{path}'") from None
+            except NotADirectoryError:
+                raise NotADirectoryError(f"Not a directory: '{path}'") from None
+
+            if not recursive:
+                names.sort()
+                return names
+
+            # Walk with scandir: DirEntry carries the entry type from the
+            # directory read, so no extra stat per entry. Like rglob(),
+            # symlinked directories are listed but not descended into, and
+            # unreadable subdirectories are skipped.
+            results = []
+            stack = [("", str(resolved))]
+            while stack:
+                prefix, top = stack.pop()
+                try:
+                    it = os.scandir(top)
+                except PermissionError:
+                    continue
+                with it:
+                    for entry in it:
+                        rel = prefix + entry.name
+                        results.append(rel)
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((rel + os.sep, entry.path))
+            results.sort()
+            return results
+
+    def list_stat(self, path: str = ".") -> list[tuple[str, FileMetadata]]:
+        """List directory contents together with each entry's metadata.
+
+        Equivalent to calling stat() on every name from list(), from a
+        single directory scan. Symlinks are followed only when they
+        resolve inside root; entries that would fail stat() (dangling or
+        escaping links) are left out. The patched os.scandir() uses this.
 
-            if recursive:
-                results = []
-                for p in resolved.rglob("*"):
-                    results.append(str(p.relative_to(resolved)))
-                return sorted(results)
-            else:
-                return sorted([p.name for p in resolved.iterdir()])
+        Args:
+            path: Directory path to list.
+        """
+        with suspend():
+            resolved = self._validate_path(path)
+            try:
+                it = os.scandir(resolved)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"No such directory: '{path}'") from None
+            except NotADirectoryError:
+                raise NotADirectoryError(f"Not a directory: '{path}'") from None
+
+            results = []
+            with it:
+                for entry in it:
+                    # The directory itself is resolved, so only a symlink
+                    # entry can lead outside root
+                    try:
+                        if entry.is_symlink():
+                            st = os.stat(self._validate_path(entry.path))
+                        else:
+                            st = entry.stat()
+                    except (OSError, ValueError):
+                        # Dangling, unreadable, or escaping root
+                        continue
+                    is_dir = stat.S_ISDIR(st.st_mode)
+                    meta = FileMetadata(
+                        size=st.st_size if not is_dir else 0,
+                        created_at=_iso_utc(st.st_ctime),
+                        modified_at=_iso_utc(st.st_mtime),
+                        is_dir=is_dir,
+                    )
+                    results.append((entry.name, meta))
+        results.sort(key=itemgetter(0))
+        return results
 
     def remove(self, path: str) -> None:
         """Remove a file."""
         with suspend():
-            resolved = self._validate_path(path)
-            if resolved.is_dir():
-                raise IsADirectoryError(f"Is a directory: {path}")
-            resolved.unlink()
+            self._unlink_validated(self._validate_path(path), path)
+
+    @staticmethod
+    def _unlink_validated(resolved: Path, path: str) -> None:
+        """Remove a validated file path. Must be called inside suspend().
+
+        Unlinks first and only checks for a directory on failure, since
+        Linux reports EISDIR but macOS reports EPERM for unlink(dir).
+        """
+        try:
+            os.unlink(resolved)
+        except OSError:
+            if os.path.isdir(resolved):
+                raise IsADirectoryError(f"Is a directory: {path}") from None
+            raise
 
     def mkdir(
         self,
@@ -371,6 +530,7 @@ class IsolatedFS:
         with suspend():
             resolved = self._validate_path(path)
             resolved.rmdir()
+            self._known_dirs.clear()
 
     def rename(self, src: str, dst: str) -> None:
         """Rename/move a file or directory."""
@@ -379,6 +539,8 @@ class IsolatedFS:
             dst_resolved = self._validate_path(dst)
 
             src_resolved.rename(dst_resolved)
+            # A moved directory takes its subdirectories with it
+            self._known_dirs.clear()
 
     def replace(self, src: str, dst: str) -> None:
         """Replace dst with src."""
@@ -409,12 +571,11 @@ class IsolatedFS:
             target = os.readlink(unresolved)
             # Validate target stays within root
             try:
-                target_path = Path(target)
-                if target_path.is_absolute():
-                    target_path.relative_to(self.root)
+                if os.path.isabs(target):
+                    self._root_relative(target)
                 else:
-                    resolved_target = (unresolved.parent / target_path).resolve()
-                    resolved_target.relative_to(self.root)
+                    parent = str(unresolved.parent)
+                    self._root_relative(os.path.realpath(os.path.join(parent, target)))
             except ValueError:
                 raise PermissionError(f"Symlink target escapes sandbox: '{path}'")
             return target
@@ -422,9 +583,14 @@ class IsolatedFS:
     def symlink(self, src: str, dst: str) -> None:
         """Create a symbolic link."""
         with suspend():
-            dst_resolved = self._validate_path(dst)
-            # src is the target — validate it stays within root
-            src_resolved = self._validate_path(src)
+            # dst is the link being created and src is its target: validate
+            # both without following a final symlink, so a link to a link
+            # stays one rather than collapsing to the final target
+            dst_resolved = self._validate_path_no_follow(dst)
+            src_resolved = self._validate_path_no_follow(src)
+            if src_resolved.is_symlink():
+                # Still refuse to chain onto a link that leads out of root
+                self._validate_path(src_resolved)
             dst_resolved.symlink_to(src_resolved)
 
     def link(self, src: str, dst: str) -> None:
@@ -443,45 +609,37 @@ class IsolatedFS:
     def stat(self, path: str) -> FileMetadata:
         """Get file metadata."""
         with suspend():
-            resolved = self._validate_path(path)
-            if not resolved.exists():
+            stat_result = self._stat(self._validate_path(path))
+            if stat_result is None:
                 raise FileNotFoundError(f"No such file: {path}")
 
-            stat_result = resolved.stat()
+            is_dir = stat.S_ISDIR(stat_result.st_mode)
             return FileMetadata(
-                size=stat_result.st_size if not resolved.is_dir() else 0,
-                created_at=datetime.fromtimestamp(
-                    stat_result.st_ctime, tz=timezone.utc
-                ).isoformat(),
-                modified_at=datetime.fromtimestamp(
-                    stat_result.st_mtime, tz=timezone.utc
-                ).isoformat(),
-                is_dir=resolved.is_dir(),
+                size=stat_result.st_size if not is_dir else 0,
+                created_at=_iso_utc(stat_result.st_ctime),
+                modified_at=_iso_utc(stat_result.st_mtime),
+                is_dir=is_dir,
             )
 
     def get_metadata_snapshot(self) -> dict[str, FileMetadata]:
         """Get metadata for all files and directories by walking the root."""
-        with suspend():
-            result = {}
-            for item in self.root.rglob("*"):
-                rel_path = str(item.relative_to(self.root))
-                st = item.stat()
-                is_dir = item.is_dir()
-                result[rel_path] = FileMetadata(
-                    size=st.st_size if not is_dir else 0,
-                    created_at=datetime.fromtimestamp(
-                        st.st_ctime, tz=timezone.utc
-                    ).isoformat(),
-                    modified_at=datetime.fromtimestamp(
-                        st.st_mtime, tz=timezone.utc
-                    ).isoformat(),
-                    is_dir=is_dir,
-                )
-            return result
+        return {
+            info.path: FileMetadata(
+                size=info.size,
+                created_at=info.created_at,
+                modified_at=info.modified_at,
+                is_dir=info.is_dir,
+            )
+            for info in self._iter_file_info(self._root_str, recursive=True)
+        }
 
     def getsize(self, path: str) -> int:
         """Get file size in bytes."""
-        return self.stat(path).size
+        with suspend():
+            st = self._stat(self._validate_path(path))
+            if st is None:
+                raise FileNotFoundError(f"No such file: {path}")
+            return 0 if stat.S_ISDIR(st.st_mode) else st.st_size
 
     def makedirs(self, path: str, exist_ok: bool = True) -> None:
         """Create directory tree (alias for mkdir with parents=True)."""
@@ -489,13 +647,22 @@ class IsolatedFS:
 
     def write_many(self, files: dict[str, bytes]) -> None:
         """Write multiple files at once."""
-        for path, content in files.items():
-            self.write(path, content)
+        with suspend():
+            # Validate every path before touching disk, then create each
+            # distinct parent directory once rather than once per file
+            resolved = [(self._validate_path(p), c) for p, c in files.items()]
+            for parent in {r.parent for r, _ in resolved} - self._known_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                self._known_dirs.add(parent)
+            for r, content in resolved:
+                self._write_validated(r, content, "w")
 
     def remove_many(self, paths: list[str]) -> None:
         """Remove multiple files at once."""
-        for path in paths:
-            self.remove(path)
+        with suspend():
+            resolved = [(p, self._validate_path(p)) for p in paths]
+            for path, r in resolved:
+                self._unlink_validated(r, path)
 
     def list_detailed(self, path: str = ".", recursive: bool = False) -> list[FileInfo]:
         """List directory with detailed file information.
@@ -504,32 +671,65 @@ class IsolatedFS:
             path: Directory path to list.
             recursive: If True, list all nested items.
         """
+        return sorted(self.iter_list_detailed(path, recursive), key=attrgetter("path"))
+
+    def iter_list_detailed(
+        self, path: str = ".", recursive: bool = False
+    ) -> Iterator[FileInfo]:
+        """Iterate over directory entries with detailed file information.
+
+        Like list_detailed(), but entries are produced one directory at a
+        time and in no particular order, so callers can stop early without
+        paying for the whole listing.
+
+        Args:
+            path: Directory path to list.
+            recursive: If True, include all nested items.
+        """
         with suspend():
             resolved = self._validate_path(path)
 
-            if not resolved.is_dir():
+            if not os.path.isdir(resolved):
                 raise NotADirectoryError(f"Not a directory: {path}")
 
-            result = []
-            items = resolved.rglob("*") if recursive else resolved.iterdir()
-
-            for item in items:
-                rel_path = str(item.relative_to(self.root))
-                stat_info = item.stat()
-
-                result.append(
-                    FileInfo(
-                        name=item.name,
-                        path=rel_path,
-                        is_dir=item.is_dir(),
-                        size=stat_info.st_size if item.is_file() else 0,
-                        created_at=datetime.fromtimestamp(
-                            stat_info.st_ctime, tz=timezone.utc
-                        ).isoformat(),
-                        modified_at=datetime.fromtimestamp(
-                            stat_info.st_mtime, tz=timezone.utc
-                        ).isoformat(),
-                    )
-                )
-
-        return sorted(result, key=lambda x: x.path)
+        return self._iter_file_info(str(resolved), recursive)
+
+    def _iter_file_info(self, top: str, recursive: bool) -> Iterator[FileInfo]:
+        root_prefix = self._root_prefix
+
+        # Files written together share timestamps; format each distinct
+        # one once and reuse the string across entries.
+        timestamps: dict[float, str] = {}
+
+        def iso(ts: float) -> str:
+            text = timestamps.get(ts)
+            if text is None:
+                text = _iso_utc(ts)
+                timestamps[ts] = text
+            return text
+
+        pending = [top]
+        while pending:
+            # Read a whole directory with interception suspended, then yield
+            # outside the suspend() block so the caller's context between
+            # items is left untouched.
+            batch = []
+            with suspend():
+                with os.scandir(pending.pop()) as it:
+                    for entry in it:
+                        stat_info = entry.stat()
+                        is_dir = entry.is_dir()
+                        # Like rglob, don't descend into symlinked directories
+                        if recursive and is_dir and not entry.is_symlink():
+                            pending.append(entry.path)
+                        batch.append(
+                            FileInfo(
+                                name=entry.name,
+                                path=entry.path[len(root_prefix) :],
+                                is_dir=is_dir,
+                                size=stat_info.st_size if entry.is_file() else 0,
+                                created_at=iso(stat_info.st_ctime),
+                                modified_at=iso(stat_info.st_mtime),
+                            )
+                        )
+            yield from batch
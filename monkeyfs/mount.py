@@ -10,7 +10,7 @@ from __future__ import annotations
 import errno
 import os
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterator
 
 from .base import FileInfo, FileMetadata
 
@@ -217,18 +217,22 @@ class MountFS:
         return sorted(result)
 
     def list_detailed(self, path: str = ".", recursive: bool = False) -> list[FileInfo]:
+        return list(self.iter_list_detailed(path, recursive=recursive))
+
+    def iter_list_detailed(
+        self, path: str = ".", recursive: bool = False
+    ) -> Iterator[FileInfo]:
         names = self.list(path, recursive=recursive)
         abs_path = self._to_absolute(path)
         norm = abs_path.rstrip("/") if abs_path != "/" else ""
         user_prefix = path.rstrip("/")
 
-        result = []
-        for name in names:
-            full_abs = f"{norm}/{name}" if norm else f"/{name}"
-            display = f"{user_prefix}/{name}" if user_prefix != "." else name
-            meta = self.stat(full_abs)
-            result.append(
-                FileInfo(
+        def entries() -> Iterator[FileInfo]:
+            for name in names:
+                full_abs = f"{norm}/{name}" if norm else f"/{name}"
+                display = f"{user_prefix}/{name}" if user_prefix != "." else name
+                meta = self.stat(full_abs)
+                yield FileInfo(
                     name=name,
                     path=display,
                     size=meta.size,
@@ -236,8 +240,8 @@ class MountFS:
                     modified_at=meta.modified_at,
                     is_dir=meta.is_dir,
                 )
-            )
-        return result
+
+        return entries()
 
     def access(self, path: str, mode: int) -> bool:
         fs, inner = self._resolve(path)
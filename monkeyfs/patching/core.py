@@ -1,6 +1,7 @@
 """Patching infrastructure: originals, safe paths, and helpers."""
 
 import builtins
+import functools
 import os
 import os.path
 import site
@@ -57,6 +58,9 @@ _originals: dict[str, Any] = {
     "os_lseek": os.lseek,
 }
 
+# Bound once for the safe path check, which runs on every VFS miss
+_orig_lstat = _originals["lstat"]
+
 # Store fcntl originals (Posix only)
 try:
     import fcntl as _fcntl_mod
@@ -73,7 +77,7 @@ except ImportError:
 # Define safe system paths for read-only passthrough
 # We allow access to stdlib and site-packages even when FS is active
 # to support libraries that load their own resources (e.g., plotly, transformers).
-def _get_safe_paths() -> list[str]:
+def _get_unresolved_safe_paths() -> list[str]:
     paths = {
         sys.base_prefix,
         sys.prefix,
@@ -86,13 +90,40 @@ def _get_safe_paths() -> list[str]:
     if hasattr(site, "getusersitepackages"):
         paths.add(site.getusersitepackages())
 
-    # Resolve all paths (filter None for environments like Pyodide)
-    return [
-        str(Path(p).resolve()) for p in paths if p is not None and os.path.exists(p)
-    ]
+    # Filter None for environments like Pyodide
+    return [p for p in paths if p is not None and os.path.exists(p)]
+
+
+def _get_safe_paths(unresolved: list[str]) -> list[str]:
+    # Resolve all paths
+    return [str(Path(p).resolve()) for p in unresolved]
+
 
+# Discovered once; everything below is derived from this one pass
+_UNRESOLVED_SAFE_PATHS = _get_unresolved_safe_paths()
+_SAFE_SYSTEM_PATHS = tuple(_get_safe_paths(_UNRESOLVED_SAFE_PATHS))
 
-_SAFE_SYSTEM_PATHS = _get_safe_paths()
+# With a trailing separator, so "/usr/lib/python3.11" does not match
+# "/usr/lib/python3.11-other"; str.startswith() takes the whole tuple at once.
+_SAFE_SYSTEM_PREFIXES = tuple(os.path.join(p, "") for p in _SAFE_SYSTEM_PATHS)
+
+# Safe directories both as spelled (sys.prefix and friends, site-packages) and
+# as resolved, with a trailing separator. A path that lies lexically under one of them names
+# something sandboxed code cannot create or replace, so its resolution is
+# safe to cache.
+_SAFE_CACHE_ROOTS = tuple(
+    {os.path.join(os.path.abspath(p), "") for p in _UNRESOLVED_SAFE_PATHS}
+    | set(_SAFE_SYSTEM_PREFIXES)
+)
+
+# Every safe path exists and is fully resolved, so an absolute path without
+# ".." whose top-level entry is missing on the host resolves to itself and
+# cannot be inside one (unless "/" itself is safe). Such paths --
+# "/workspace/...", "/data/..." -- are the usual virtual paths and are rejected
+# after a single lstat() instead of a full realpath(). A ".." can climb back
+# out of the missing entry ("/missing/../usr/lib/..."), so those paths are
+# always resolved.
+_CHECK_TOP_LEVEL = os.sep == "/" and "/" not in _SAFE_SYSTEM_PATHS
 
 
 # Recursion guard for safe path checks
@@ -103,18 +134,55 @@ _in_safe_path_check: ContextVar[bool] = ContextVar("in_safe_path_check", default
 _in_vfs_operation: ContextVar[bool] = ContextVar("in_vfs_operation", default=False)
 
 
+def _resolve_for_safe_check(path: str | Path) -> str:
+    """Resolve path with os.path.realpath, without re-entering the patches."""
+    # Prevent recursion when realpath calls lstat/stat
+    token = _in_safe_path_check.set(True)
+    try:
+        return os.path.realpath(path)
+    finally:
+        _in_safe_path_check.reset(token)
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_cached(path_str: str) -> str:
+    """_resolve_for_safe_check() for absolute paths under _SAFE_CACHE_ROOTS."""
+    return _resolve_for_safe_check(path_str)
+
+
+def _top_level_missing(path: str | bytes) -> bool:
+    """True if an absolute path without ".." starts with a missing host entry."""
+    if not isinstance(path, str) or not path.startswith("/") or ".." in path:
+        return False
+    try:
+        _orig_lstat("/" + path.split("/", 2)[1])
+    except FileNotFoundError:
+        return True
+    return False
+
+
 def _is_safe_system_path(path: str | Path) -> bool:
     """Check if path is within a safe system directory."""
     try:
-        # Prevent recursion when realpath calls lstat/stat
-        token = _in_safe_path_check.set(True)
-        try:
-            # Resolve to absolute path using os.path.realpath
-            path_str = os.path.realpath(path)
-        finally:
-            _in_safe_path_check.reset(token)
-
-        return any(path_str.startswith(sp) for sp in _SAFE_SYSTEM_PATHS)
+        # Library resources (stdlib, site-packages) are checked over and over,
+        # e.g. by the import system; cache those. Anything else, including
+        # relative paths (which depend on the CWD) and paths that could climb
+        # out of a safe directory with "..", is resolved every time.
+        path = os.fspath(path)
+        if (
+            isinstance(path, str)
+            and path.startswith(_SAFE_CACHE_ROOTS)
+            and ".." not in path
+        ):
+            path_str = _resolve_cached(path)
+        elif _CHECK_TOP_LEVEL and _top_level_missing(path):
+            return False
+        else:
+            path_str = _resolve_for_safe_check(path)
+
+        return path_str in _SAFE_SYSTEM_PATHS or path_str.startswith(
+            _SAFE_SYSTEM_PREFIXES
+        )
     except (OSError, ValueError):
         return False
 
@@ -134,6 +202,11 @@ def _fs_list(fs: Any, path: str) -> list[str]:
 
 def _metadata_to_stat_result(meta: FileMetadata) -> os.stat_result:
     """Convert FileMetadata to os.stat_result."""
+    # FileMetadata is immutable, so its conversion is built once and reused
+    # (VirtualFS returns the same instance for repeated stats of a path)
+    if type(meta) is FileMetadata:
+        return meta._to_stat_result()
+    # Other stat-like objects from third-party filesystems
     return os.stat_result(
         (
             meta.st_mode,
@@ -11,22 +11,48 @@ import errno
 import io
 import os
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
+from .core import _in_vfs_operation
+
 
 @dataclass
 class VirtualFD:
-    """State for a single virtual file descriptor."""
+    """State for a single virtual file descriptor.
+
+    Existing content is read from ``fs`` the first time ``buffer`` is used,
+    so an fd that is only fstat()-ed or closed never loads the file.
+    """
 
     path: str
     fs: Any
-    buffer: io.BytesIO
     flags: int
     mode: int
     writable: bool
     readable: bool
     closed: bool = False
+    loaded: bool = True
+    dirty: bool = False
+    _buffer: io.BytesIO = field(default_factory=io.BytesIO, repr=False)
+
+    @property
+    def buffer(self) -> io.BytesIO:
+        """In-memory content, loaded from the filesystem on first access."""
+        if not self.loaded:
+            token = _in_vfs_operation.set(True)
+            try:
+                content = self.fs.read(self.path)
+            except FileNotFoundError:
+                content = b""
+            finally:
+                _in_vfs_operation.reset(token)
+            # BytesIO built from bytes shares them until the first write
+            self._buffer = io.BytesIO(content)
+            if self.flags & os.O_APPEND:
+                self._buffer.seek(0, io.SEEK_END)
+            self.loaded = True
+        return self._buffer
 
 
 class VirtualFDTable:
@@ -70,25 +96,11 @@ class VirtualFDTable:
         if not (flags & os.O_CREAT) and not file_exists:
             raise FileNotFoundError(errno.ENOENT, "No such file or directory", path)
 
-        # Load existing content into buffer
-        buf = io.BytesIO()
-        if file_exists and not (flags & os.O_TRUNC):
-            try:
-                content = fs.read(resolved)
-                buf.write(content)
-                if not (flags & os.O_APPEND):
-                    buf.seek(0)
-                # O_APPEND: position stays at end
-            except FileNotFoundError:
-                pass
-
         # O_CREAT on new file: register it in VFS
         if (flags & os.O_CREAT) and not file_exists:
             parent = os.path.dirname(resolved)
             if parent and parent != "/" and hasattr(fs, "makedirs"):
                 fs.makedirs(parent, exist_ok=True)
-            from .core import _in_vfs_operation
-
             token = _in_vfs_operation.set(True)
             try:
                 fs.write(resolved, b"")
@@ -101,11 +113,14 @@ class VirtualFDTable:
             self._table[fd] = VirtualFD(
                 path=resolved,
                 fs=fs,
-                buffer=buf,
                 flags=flags,
                 mode=file_mode,
                 writable=writable,
                 readable=readable,
+                # Existing content is loaded on first use of the buffer
+                loaded=not file_exists or bool(flags & os.O_TRUNC),
+                # A truncation must be written back even with no writes
+                dirty=file_exists and bool(flags & os.O_TRUNC),
             )
 
         return fd
@@ -134,10 +149,9 @@ class VirtualFDTable:
 
         vfd.closed = True
 
-        if vfd.writable:
+        # Only content changed through this fd is written back
+        if vfd.writable and vfd.dirty:
             content = vfd.buffer.getvalue()
-            from .core import _in_vfs_operation
-
             token = _in_vfs_operation.set(True)
             try:
                 vfd.fs.write(vfd.path, content)
@@ -161,14 +175,14 @@ class VirtualFDRawIO(io.RawIOBase):
         self._vfd = vfd
         self.name = vfd.path
 
+    # BytesIO reads into and copies from any buffer directly, so neither
+    # direction needs an intermediate bytes object
     def readinto(self, b: bytearray | memoryview) -> int:  # type: ignore[override]
-        data = self._vfd.buffer.read(len(b))
-        n = len(data)
-        b[:n] = data
-        return n
+        return self._vfd.buffer.readinto(b)
 
     def write(self, b: bytes | bytearray | memoryview) -> int:  # type: ignore[override]
-        return self._vfd.buffer.write(bytes(b))
+        self._vfd.dirty = True
+        return self._vfd.buffer.write(b)
 
     def readable(self) -> bool:
         return self._vfd.readable
@@ -15,6 +15,7 @@ from typing import Any, Iterator
 from ..context import current_fs
 from .core import _fcntl_mod, _has_fcntl, _originals
 from .patches import (
+    _real_fds_only,
     _vfs_abspath,
     _vfs_access,
     _vfs_chdir,
@@ -240,6 +241,16 @@ def _apply_patches() -> None:
         _fcntl_mod.flock = _vfs_flock  # type: ignore[assignment]
         _fcntl_mod.lockf = _vfs_lockf  # type: ignore[assignment]
 
+    # Patch shutil's kernel fast-copy helpers to give up on virtual files,
+    # keeping zero-copy for real fds on both sides
+    for name in (
+        "_fastcopy_sendfile",
+        "_fastcopy_fcopyfile",
+        "_fastcopy_copy_file_range",
+    ):
+        if hasattr(shutil, name):
+            setattr(shutil, name, _real_fds_only(getattr(shutil, name)))
+
     # Patch tempfile's cached os.unlink reference.
     # _TemporaryFileCloser.cleanup captures os.unlink as a default arg at
     # import time, bypassing our runtime patches. Re-bind it so
@@ -279,19 +290,12 @@ def patch(fs: Any) -> Iterator[None]:
 
     # Disable shutil platform optimizations that bypass our patches.
     # _use_fd_functions: rmtree uses os.open/fstat/scandir(fd) — bypasses string-path patches.
-    # _HAS_FCOPYFILE: macOS fcopyfile on raw fds — VFS files lack fileno(), wastes try/except.
-    # _USE_CP_SENDFILE: Linux sendfile on raw fds — same issue.
-    # _USE_CP_COPY_FILE_RANGE: Python 3.14+ copy_file_range — same issue.
+    # The kernel fast-copy paths (sendfile, fcopyfile, copy_file_range) stay
+    # on; install() makes them give up on files without a real fd.
     saved_shutil = {}
-    for flag in (
-        "_use_fd_functions",
-        "_HAS_FCOPYFILE",
-        "_USE_CP_SENDFILE",
-        "_USE_CP_COPY_FILE_RANGE",
-    ):
-        if hasattr(shutil, flag):
-            saved_shutil[flag] = getattr(shutil, flag)
-            setattr(shutil, flag, False)
+    if hasattr(shutil, "_use_fd_functions"):
+        saved_shutil["_use_fd_functions"] = shutil._use_fd_functions
+        shutil._use_fd_functions = False
 
     # Python 3.14+: _rmtree_impl is bound at import time, so setting
     # _use_fd_functions=False doesn't affect which rmtree runs. Override
@@ -2,13 +2,19 @@
 
 import builtins
 import errno
+import functools
 import os
 import re
+import shutil
+import stat
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Callable, Iterator
 
+from ..base import FileMetadata
 from ..context import current_fs
 from .core import (
+    _SAFE_CACHE_ROOTS,
     _fs_list,
     _in_safe_path_check,
     _in_vfs_operation,
@@ -19,16 +25,69 @@ from .core import (
 )
 from .fdtable import _fd_table, _wrap_virtual_fd
 
+# Bound once: every wrapper starts with this lookup, and outside patch() the
+# answer is None and the wrapper falls straight through to the original.
+_get_fs = current_fs.get
+
+# Originals as module globals: a global load per call instead of a dict lookup.
+# Platform-specific ones (link, chown, fcntl) are None where unavailable;
+# their wrappers are only installed where they exist.
+_orig_abspath = _originals["abspath"]
+_orig_access = _originals["access"]
+_orig_chdir = _originals["chdir"]
+_orig_chmod = _originals["chmod"]
+_orig_chown = _originals.get("chown")
+_orig_exists = _originals["exists"]
+_orig_expanduser = _originals["expanduser"]
+_orig_expandvars = _originals["expandvars"]
+_orig_fcntl = _originals.get("fcntl")
+_orig_flock = _originals.get("flock")
+_orig_getcwd = _originals["getcwd"]
+_orig_getenv = _originals["getenv"]
+_orig_getsize = _originals["getsize"]
+_orig_isdir = _originals["isdir"]
+_orig_isfile = _originals["isfile"]
+_orig_islink = _originals["islink"]
+_orig_lexists = _originals["lexists"]
+_orig_link = _originals.get("link")
+_orig_listdir = _originals["listdir"]
+_orig_lockf = _originals.get("lockf")
+_orig_lstat = _originals["lstat"]
+_orig_makedirs = _originals["makedirs"]
+_orig_mkdir = _originals["mkdir"]
+_orig_open = _originals["open"]
+_orig_os_close = _originals["os_close"]
+_orig_os_fstat = _originals["os_fstat"]
+_orig_os_lseek = _originals["os_lseek"]
+_orig_os_open = _originals["os_open"]
+_orig_os_read = _originals["os_read"]
+_orig_os_write = _originals["os_write"]
+_orig_readlink = _originals["readlink"]
+_orig_realpath = _originals["realpath"]
+_orig_remove = _originals["remove"]
+_orig_rename = _originals["rename"]
+_orig_replace = _originals["replace"]
+_orig_rmdir = _originals["rmdir"]
+_orig_samefile = _originals["samefile"]
+_orig_scandir = _originals["scandir"]
+_orig_stat = _originals["stat"]
+_orig_symlink = _originals["symlink"]
+_orig_truncate = _originals["truncate"]
+_orig_unlink = _originals["unlink"]
+_orig_utime = _originals["utime"]
+
 
 def _vfs_open(path: Any, *args: Any, **kwargs: Any) -> Any:
     """FileSystem-aware open() replacement."""
+    fs = _get_fs()
+    if fs is None and not isinstance(path, int):
+        return _orig_open(path, *args, **kwargs)
+
     mode = args[0] if args else kwargs.get("mode", "r")
 
     # Recursion guard: if we're already in an FS operation, use original open
     if _in_vfs_operation.get():
-        return _originals["open"](path, *args, **kwargs)
-
-    fs = current_fs.get()
+        return _orig_open(path, *args, **kwargs)
 
     # Integer fd path (os.fdopen): wrap virtual fd in a file object
     if isinstance(path, int) and _fd_table.is_virtual(path):
@@ -52,7 +111,7 @@ def _vfs_open(path: Any, *args: Any, **kwargs: Any) -> Any:
                 return _wrap_virtual_fd(fd, mode, _fd_table, **wrap_kwargs)
             else:
                 # Real fd from opener, use original fdopen
-                return _originals["open"](fd, *args, **kwargs)
+                return _orig_open(fd, *args, **kwargs)
 
         token = _in_vfs_operation.set(True)
         try:
@@ -65,12 +124,12 @@ def _vfs_open(path: Any, *args: Any, **kwargs: Any) -> Any:
                 and "x" not in mode
                 and _is_safe_system_path(path)
             ):
-                return _originals["open"](path, *args, **kwargs)
+                return _orig_open(path, *args, **kwargs)
             raise
         finally:
             _in_vfs_operation.reset(token)
 
-    return _originals["open"](path, *args, **kwargs)
+    return _orig_open(path, *args, **kwargs)
 
 
 def _mode_to_flags(mode: str) -> int:
@@ -95,7 +154,7 @@ def _mode_to_flags(mode: str) -> int:
 
 def _vfs_listdir(path: str = ".") -> list[str]:
     """FileSystem-aware os.listdir() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         path_str = str(path)
         try:
@@ -103,17 +162,17 @@ def _vfs_listdir(path: str = ".") -> list[str]:
                 return _fs_list(fs, path_str)
         except (PermissionError, FileNotFoundError, NotADirectoryError):
             if _is_safe_system_path(path):
-                return _originals["listdir"](path)
+                return _orig_listdir(path)
             raise
 
-        if _is_safe_system_path(path) and _originals["isdir"](path):
-            return _originals["listdir"](path)
+        if _is_safe_system_path(path) and _orig_isdir(path):
+            return _orig_listdir(path)
 
         raise FileNotFoundError(
             errno.ENOENT, f"No such file or directory: '{path}'", path
         )
 
-    return _originals["listdir"](path)
+    return _orig_listdir(path)
 
 
 class MockDirEntry:
@@ -182,24 +241,37 @@ class ScandirWrapper:
 
 def _vfs_scandir(path: str = ".") -> Any:
     """FileSystem-aware os.scandir() replacement."""
-    if current_fs.get() is None:
-        return _originals["scandir"](path)
+    if _get_fs() is None:
+        return _orig_scandir(path)
 
     def _scan_gen() -> Iterator[os.DirEntry[str]]:
-        fs = current_fs.get()
+        fs = _get_fs()
         if fs is not None:
             path_str = str(path)
+            # Entry paths are the scanned path joined with each name; join
+            # once so the loops only concatenate
+            prefix = os.path.join(path_str, "")
             try:
+                # Optional fast path: names and metadata in one call, rather
+                # than a stat() round trip per child
+                list_stat = getattr(fs, "list_stat", None)
+                if list_stat is not None:
+                    for name, meta in list_stat(path_str):
+                        st = _metadata_to_stat_result(meta)
+                        child_path = prefix + name
+                        yield MockDirEntry(name, meta.is_dir, st, path=child_path)  # type: ignore[misc]
+                    return
+
                 if not fs.isdir(path_str):
                     raise NotADirectoryError(f"Not a directory: {path}")
 
                 names = _fs_list(fs, path_str)
                 for name in names:
-                    child_path = os.path.join(path_str, name)
+                    child_path = prefix + name
                     try:
                         meta = fs.stat(child_path)
                         st = _metadata_to_stat_result(meta)
-                        is_d = fs.isdir(child_path)
+                        is_d = stat.S_ISDIR(st.st_mode)
                         yield MockDirEntry(name, is_d, st, path=child_path)  # type: ignore[misc]
                     except (FileNotFoundError, OSError):
                         continue
@@ -207,12 +279,12 @@ def _vfs_scandir(path: str = ".") -> Any:
 
             except (PermissionError, FileNotFoundError, NotADirectoryError):
                 if _is_safe_system_path(path):
-                    with _originals["scandir"](path) as it:
+                    with _orig_scandir(path) as it:
                         yield from it
                     return
                 raise
 
-        with _originals["scandir"](path) as it:
+        with _orig_scandir(path) as it:
             yield from it
 
     return ScandirWrapper(_scan_gen())
@@ -232,98 +304,106 @@ def _vfs_glob_scandir(path: str = ".") -> Any:
 
 def _vfs_remove(path: str, **kwargs: Any) -> None:
     """FileSystem-aware os.remove() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         return fs.remove(str(path))
-    return _originals["remove"](path, **kwargs)
+    return _orig_remove(path, **kwargs)
 
 
 def _vfs_unlink(path: str, **kwargs: Any) -> None:
     """FileSystem-aware os.unlink() replacement (alias for remove)."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         return fs.remove(str(path))
-    return _originals["unlink"](path, **kwargs)
+    return _orig_unlink(path, **kwargs)
 
 
 def _vfs_mkdir(path: str, mode: int = 0o777, **kwargs: Any) -> None:
     """FileSystem-aware os.mkdir() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         return fs.mkdir(str(path), mode=mode)
-    return _originals["mkdir"](path, mode, **kwargs)
+    return _orig_mkdir(path, mode, **kwargs)
 
 
 def _vfs_makedirs(path: str, mode: int = 0o777, exist_ok: bool = False) -> None:
     """FileSystem-aware os.makedirs() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         return fs.makedirs(str(path), exist_ok=exist_ok)
-    return _originals["makedirs"](path, mode, exist_ok=exist_ok)
+    return _orig_makedirs(path, mode, exist_ok=exist_ok)
 
 
 def _vfs_rmdir(path: str, *, dir_fd: int | None = None) -> None:
     """FileSystem-aware os.rmdir() replacement."""
     if dir_fd is not None:
-        return _originals["rmdir"](path, dir_fd=dir_fd)
+        return _orig_rmdir(path, dir_fd=dir_fd)
 
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         return _require(fs, "rmdir")(str(path))
-    return _originals["rmdir"](path)
+    return _orig_rmdir(path)
 
 
 def _vfs_rename(src: str, dst: str, **kwargs: Any) -> None:
     """FileSystem-aware os.rename() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         return fs.rename(str(src), str(dst))
-    return _originals["rename"](src, dst, **kwargs)
+    return _orig_rename(src, dst, **kwargs)
 
 
 def _vfs_stat(path: str, **kwargs: Any) -> Any:
     """FileSystem-aware os.stat() replacement."""
-    if _in_safe_path_check.get():
-        return _originals["stat"](path, **kwargs)
-
-    fs = current_fs.get()
-    if fs is not None:
-        path_str = str(path)
-        try:
-            meta = fs.stat(path_str)
-            return _metadata_to_stat_result(meta)
-        except PermissionError:
-            if _is_safe_system_path(path):
-                return _originals["stat"](path, **kwargs)
-            raise
-        except (FileNotFoundError, NotADirectoryError):
-            if _is_safe_system_path(path):
-                return _originals["stat"](path, **kwargs)
-            # Re-raise with errno so pathlib and other consumers work correctly
-            raise FileNotFoundError(
-                errno.ENOENT, os.strerror(errno.ENOENT), path_str
-            ) from None
-
-    return _originals["stat"](path, **kwargs)
+    fs = _get_fs()
+    if fs is None or _in_safe_path_check.get():
+        return _orig_stat(path, **kwargs)
+
+    path_str = str(path)
+    try:
+        meta = fs.stat(path_str)
+        return _metadata_to_stat_result(meta)
+    except PermissionError:
+        if _is_safe_system_path(path):
+            return _orig_stat(path, **kwargs)
+        raise
+    except (FileNotFoundError, NotADirectoryError):
+        if _is_safe_system_path(path):
+            return _orig_stat(path, **kwargs)
+        # Re-raise with errno so pathlib and other consumers work correctly
+        raise FileNotFoundError(
+            errno.ENOENT, os.strerror(errno.ENOENT), path_str
+        ) from None
 
 
 def _vfs_lstat(path: str, **kwargs: Any) -> Any:
     """FileSystem-aware os.lstat() replacement."""
-    if _in_safe_path_check.get():
-        return _originals["lstat"](path, **kwargs)
-
-    fs = current_fs.get()
-    if fs is not None:
-        # FS implementations don't distinguish lstat from stat;
-        # delegate to _vfs_stat which handles errno for FileNotFoundError
-        return _vfs_stat(path, **kwargs)
-
-    return _originals["lstat"](path, **kwargs)
+    fs = _get_fs()
+    if fs is None or _in_safe_path_check.get():
+        return _orig_lstat(path, **kwargs)
+
+    # FS implementations don't distinguish lstat from stat, so this mirrors
+    # _vfs_stat; only safe system paths keep real lstat semantics
+    path_str = str(path)
+    try:
+        meta = fs.stat(path_str)
+        return _metadata_to_stat_result(meta)
+    except PermissionError:
+        if _is_safe_system_path(path):
+            return _orig_lstat(path, **kwargs)
+        raise
+    except (FileNotFoundError, NotADirectoryError):
+        if _is_safe_system_path(path):
+            return _orig_lstat(path, **kwargs)
+        # Re-raise with errno so pathlib and other consumers work correctly
+        raise FileNotFoundError(
+            errno.ENOENT, os.strerror(errno.ENOENT), path_str
+        ) from None
 
 
 def _vfs_exists(path: str, **kwargs: Any) -> bool:
     """FileSystem-aware os.path.exists() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         try:
             if fs.exists(str(path)):
@@ -331,15 +411,15 @@ def _vfs_exists(path: str, **kwargs: Any) -> bool:
         except PermissionError:
             pass
         if _is_safe_system_path(path):
-            return _originals["exists"](path, **kwargs)
+            return _orig_exists(path, **kwargs)
         return False
 
-    return _originals["exists"](path, **kwargs)
+    return _orig_exists(path, **kwargs)
 
 
 def _vfs_isfile(path: str, **kwargs: Any) -> bool:
     """FileSystem-aware os.path.isfile() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         try:
             if fs.isfile(str(path)):
@@ -347,15 +427,15 @@ def _vfs_isfile(path: str, **kwargs: Any) -> bool:
         except PermissionError:
             pass
         if _is_safe_system_path(path):
-            return _originals["isfile"](path, **kwargs)
+            return _orig_isfile(path, **kwargs)
         return False
 
-    return _originals["isfile"](path, **kwargs)
+    return _orig_isfile(path, **kwargs)
 
 
 def _vfs_isdir(path: str, **kwargs: Any) -> bool:
     """FileSystem-aware os.path.isdir() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         try:
             if fs.isdir(str(path)):
@@ -363,99 +443,109 @@ def _vfs_isdir(path: str, **kwargs: Any) -> bool:
         except PermissionError:
             pass
         if _is_safe_system_path(path):
-            return _originals["isdir"](path, **kwargs)
+            return _orig_isdir(path, **kwargs)
         return False
 
-    return _originals["isdir"](path, **kwargs)
+    return _orig_isdir(path, **kwargs)
 
 
 def _vfs_islink(path: str, **kwargs: Any) -> bool:
     """FileSystem-aware os.path.islink() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         try:
             return _require(fs, "islink")(str(path))
         except PermissionError:
             pass
         if _is_safe_system_path(path):
-            return _originals["islink"](path, **kwargs)
+            return _orig_islink(path, **kwargs)
         return False
 
-    return _originals["islink"](path, **kwargs)
+    return _orig_islink(path, **kwargs)
 
 
 def _vfs_lexists(path: str, **kwargs: Any) -> bool:
     """FileSystem-aware os.path.lexists() replacement."""
-    return _vfs_exists(path, **kwargs)
+    if _get_fs() is not None:
+        return _vfs_exists(path, **kwargs)
+
+    return _orig_lexists(path, **kwargs)
 
 
 def _vfs_samefile(path1: str, path2: str, **kwargs: Any) -> bool:
     """FileSystem-aware os.path.samefile() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         try:
             return _require(fs, "samefile")(str(path1), str(path2))
         except (PermissionError, FileNotFoundError):
             if _is_safe_system_path(path1) and _is_safe_system_path(path2):
-                return _originals["samefile"](path1, path2, **kwargs)
+                return _orig_samefile(path1, path2, **kwargs)
             raise
 
-    return _originals["samefile"](path1, path2, **kwargs)
+    return _orig_samefile(path1, path2, **kwargs)
 
 
 def _vfs_realpath(path: str | os.PathLike[Any], **kwargs: Any) -> str:
     """FileSystem-aware os.path.realpath() replacement."""
-    if _in_safe_path_check.get():
-        return _originals["realpath"](path, **kwargs)
-
-    fs = current_fs.get()
-    if fs is not None:
-        path_str = str(path)
-        try:
-            return _require(fs, "realpath")(path_str)
-        except PermissionError:
-            if _is_safe_system_path(path):
-                return _originals["realpath"](path, **kwargs)
-            return os.path.normpath(os.path.join("/", path_str))
-
-    return _originals["realpath"](path, **kwargs)
+    fs = _get_fs()
+    if fs is None or _in_safe_path_check.get():
+        return _orig_realpath(path, **kwargs)
+
+    path_str = str(path)
+    try:
+        return _require(fs, "realpath")(path_str)
+    except PermissionError:
+        if _is_safe_system_path(path):
+            return _orig_realpath(path, **kwargs)
+        return os.path.normpath(os.path.join("/", path_str))
 
 
 def _vfs_getsize(path: str, **kwargs: Any) -> int:
     """FileSystem-aware os.path.getsize() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         try:
             return _require(fs, "getsize")(str(path))
         except (PermissionError, FileNotFoundError):
             if _is_safe_system_path(path):
-                return _originals["getsize"](path, **kwargs)
+                return _orig_getsize(path, **kwargs)
             raise
 
-    return _originals["getsize"](path, **kwargs)
+    return _orig_getsize(path, **kwargs)
 
 
 def _vfs_getcwd() -> str:
     """FileSystem-aware os.getcwd() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         return fs.getcwd()
-    return _originals["getcwd"]()
+    return _orig_getcwd()
 
 
 def _vfs_chdir(path: str) -> None:
     """FileSystem-aware os.chdir() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         return fs.chdir(str(path))
-    return _originals["chdir"](path)
+    return _orig_chdir(path)
 
 
 def _vfs_abspath(path: str | os.PathLike[Any]) -> str:
     """FileSystem-aware os.path.abspath() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         path_str = str(path)
+        # Already canonical: absolute, with no empty, "." or ".." components
+        # and no trailing slash (a "/." anywhere, e.g. "/.cache", just takes
+        # the slow path)
+        if (
+            path_str.startswith("/")
+            and "//" not in path_str
+            and "/." not in path_str
+            and not path_str.endswith("/")
+        ):
+            return path_str
         if not os.path.isabs(path_str):
             path_str = os.path.join(fs.getcwd(), path_str)
         result = os.path.normpath(path_str)
@@ -463,7 +553,7 @@ def _vfs_abspath(path: str | os.PathLike[Any]) -> str:
             result = "/" + result
         return result
 
-    return _originals["abspath"](path)
+    return _orig_abspath(path)
 
 
 def _vfs_expanduser(path: str | os.PathLike[Any]) -> str:
@@ -472,13 +562,13 @@ def _vfs_expanduser(path: str | os.PathLike[Any]) -> str:
     When FS is active, expands '~' to '/' (the virtual root)
     instead of the real home directory to prevent path leaks.
     """
-    if current_fs.get() is not None:
+    if _get_fs() is not None:
         path_str = os.fspath(path) if not isinstance(path, str) else path
         if path_str.startswith("~"):
             return "/" + path_str[2:] if path_str.startswith("~/") else "/"
         return path_str
 
-    return _originals["expanduser"](path)
+    return _orig_expanduser(path)
 
 
 def _vfs_getenv(key: str, default: str | None = None) -> str | None:
@@ -487,10 +577,17 @@ def _vfs_getenv(key: str, default: str | None = None) -> str | None:
     When FS is active, returns '/' for 'HOME' requests
     to prevent home directory path leaks.
     """
-    if current_fs.get() is not None and key == "HOME":
+    if key == "HOME" and _get_fs() is not None:
         return "/"
 
-    return _originals["getenv"](key, default)
+    return _orig_getenv(key, default)
+
+
+# $HOME references rewritten by _vfs_expandvars, applied in this order (a
+# later pattern may match text produced by an earlier substitution)
+_HOME_VAR_PATTERNS = tuple(
+    re.compile(p) for p in (r"\$HOME/", r"\$\{HOME\}/", r"\$HOME\b", r"\$\{HOME\}")
+)
 
 
 def _vfs_expandvars(path: str | os.PathLike[Any]) -> str:
@@ -499,15 +596,15 @@ def _vfs_expandvars(path: str | os.PathLike[Any]) -> str:
     When FS is active, replaces $HOME with '/' to prevent
     home directory path leaks.
     """
-    if current_fs.get() is not None:
+    if _get_fs() is not None:
         path_str = os.fspath(path) if not isinstance(path, str) else path
-        path_str = re.sub(r"\$HOME/", "/", path_str)
-        path_str = re.sub(r"\$\{HOME\}/", "/", path_str)
-        path_str = re.sub(r"\$HOME\b", "/", path_str)
-        path_str = re.sub(r"\$\{HOME\}", "/", path_str)
+        if "$" not in path_str:
+            return path_str
+        for pattern in _HOME_VAR_PATTERNS:
+            path_str = pattern.sub("/", path_str)
         return path_str
 
-    return _originals["expandvars"](path)
+    return _orig_expandvars(path)
 
 
 def _vfs_utime(
@@ -516,118 +613,139 @@ def _vfs_utime(
     **kwargs: Any,
 ) -> None:
     """FileSystem-aware os.utime() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         path_str = str(path)
         if fs.exists(path_str):
             return _require(fs, "utime")(path_str, times)
         if _is_safe_system_path(path_str):
-            return _originals["utime"](path_str, times, **kwargs)
+            return _orig_utime(path_str, times, **kwargs)
         raise FileNotFoundError(
             errno.ENOENT, f"No such file or directory: '{path_str}'", path_str
         )
 
-    return _originals["utime"](path, times, **kwargs)
+    return _orig_utime(path, times, **kwargs)
 
 
 def _vfs_replace(src: str, dst: str, **kwargs: Any) -> None:
     """FileSystem-aware os.replace() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         return _require(fs, "replace")(str(src), str(dst))
-    return _originals["replace"](src, dst, **kwargs)
+    return _orig_replace(src, dst, **kwargs)
 
 
 def _vfs_access(path: str, mode: int, **kwargs: Any) -> bool:
     """FileSystem-aware os.access() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         try:
             return _require(fs, "access")(str(path), mode)
         except (PermissionError, FileNotFoundError):
             if _is_safe_system_path(path):
-                return _originals["access"](path, mode, **kwargs)
+                return _orig_access(path, mode, **kwargs)
             raise
-    return _originals["access"](path, mode, **kwargs)
+    return _orig_access(path, mode, **kwargs)
 
 
 def _vfs_readlink(path: str, **kwargs: Any) -> str:
     """FileSystem-aware os.readlink() replacement."""
-    if _in_safe_path_check.get():
-        return _originals["readlink"](path, **kwargs)
+    fs = _get_fs()
+    if fs is None or _in_safe_path_check.get():
+        return _orig_readlink(path, **kwargs)
 
-    fs = current_fs.get()
-    if fs is not None:
-        try:
-            return _require(fs, "readlink")(str(path))
-        except (PermissionError, FileNotFoundError, OSError):
-            if _is_safe_system_path(path):
-                return _originals["readlink"](path, **kwargs)
-            raise
-    return _originals["readlink"](path, **kwargs)
+    try:
+        return _require(fs, "readlink")(str(path))
+    except (PermissionError, FileNotFoundError, OSError):
+        if _is_safe_system_path(path):
+            return _orig_readlink(path, **kwargs)
+        raise
 
 
 def _vfs_symlink(src: str, dst: str, *args: Any, **kwargs: Any) -> None:
     """FileSystem-aware os.symlink() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         return _require(fs, "symlink")(str(src), str(dst))
-    return _originals["symlink"](src, dst, *args, **kwargs)
+    return _orig_symlink(src, dst, *args, **kwargs)
 
 
 def _vfs_link(src: str, dst: str, **kwargs: Any) -> None:
     """FileSystem-aware os.link() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         return _require(fs, "link")(str(src), str(dst))
-    return _originals["link"](src, dst, **kwargs)
+    return _orig_link(src, dst, **kwargs)
 
 
 def _vfs_chmod(path: str, mode: int, **kwargs: Any) -> None:
     """FileSystem-aware os.chmod() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         return _require(fs, "chmod")(str(path), mode)
-    return _originals["chmod"](path, mode, **kwargs)
+    return _orig_chmod(path, mode, **kwargs)
 
 
 def _vfs_chown(path: str, uid: int, gid: int, **kwargs: Any) -> None:
     """FileSystem-aware os.chown() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         return _require(fs, "chown")(str(path), uid, gid)
-    return _originals["chown"](path, uid, gid, **kwargs)
+    return _orig_chown(path, uid, gid, **kwargs)
 
 
 def _vfs_truncate(path: str, length: int) -> None:
     """FileSystem-aware os.truncate() replacement."""
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None:
         return _require(fs, "truncate")(str(path), length)
-    return _originals["truncate"](path, length)
+    return _orig_truncate(path, length)
 
 
 def _vfs_fcntl(fd: int, cmd: int, arg: Any = 0) -> Any:
     """FileSystem-aware fcntl.fcntl() replacement — no-op under VFS."""
-    if current_fs.get() is not None:
+    if _get_fs() is not None:
         return 0
-    return _originals["fcntl"](fd, cmd, arg)
+    return _orig_fcntl(fd, cmd, arg)
 
 
 def _vfs_flock(fd: int, operation: int) -> None:
     """FileSystem-aware fcntl.flock() replacement — no-op under VFS."""
-    if current_fs.get() is not None:
+    if _get_fs() is not None:
         return
-    return _originals["flock"](fd, operation)
+    return _orig_flock(fd, operation)
 
 
 def _vfs_lockf(
     fd: int, cmd: int, length: int = 0, start: int = 0, whence: int = 0
 ) -> Any:
     """FileSystem-aware fcntl.lockf() replacement — no-op under VFS."""
-    if current_fs.get() is not None:
+    if _get_fs() is not None:
         return None
-    return _originals["lockf"](fd, cmd, length, start, whence)
+    return _orig_lockf(fd, cmd, length, start, whence)
+
+
+def _real_fds_only(fastcopy: Callable[..., None]) -> Callable[..., None]:
+    """Wrap a shutil kernel fast-copy helper (sendfile, fcopyfile, ...).
+
+    Under FS, files may have no fd or a virtual one from the fd table; give
+    up on the fast copy for those, so shutil falls back to read/write. Real
+    files on both sides (e.g. from IsolatedFS) keep the kernel copy.
+    """
+
+    @functools.wraps(fastcopy)
+    def wrapper(fsrc: Any, fdst: Any, *args: Any) -> None:
+        if _get_fs() is not None:
+            try:
+                infd = fsrc.fileno()
+                outfd = fdst.fileno()
+            except Exception as err:
+                raise shutil._GiveupOnFastCopy(err)  # type: ignore[attr-defined]
+            if _fd_table.is_virtual(infd) or _fd_table.is_virtual(outfd):
+                raise shutil._GiveupOnFastCopy("virtual file descriptor")  # type: ignore[attr-defined]
+        return fastcopy(fsrc, fdst, *args)
+
+    return wrapper
 
 
 def _vfs_touch(self: Path, mode: int = 0o666, exist_ok: bool = True) -> None:
@@ -655,33 +773,40 @@ def _vfs_os_open(
 ) -> int:
     """VFS-aware os.open() replacement."""
     if dir_fd is not None:
-        return _originals["os_open"](path, flags, mode, dir_fd=dir_fd)
+        return _orig_os_open(path, flags, mode, dir_fd=dir_fd)
 
     if _in_vfs_operation.get():
-        return _originals["os_open"](path, flags, mode)
+        return _orig_os_open(path, flags, mode)
 
-    fs = current_fs.get()
+    fs = _get_fs()
     if fs is not None and isinstance(path, (str, Path)):
         path_str = str(path)
 
-        # Read-only opens on safe system paths pass through
+        # Read-only opens on safe system paths pass through. Paths spelled
+        # under a library root are checked first (the check is cached for
+        # them); anything else tries the FS first and is only checked
+        # (uncached) if the FS does not have it.
         is_write = flags & (
             os.O_CREAT | os.O_WRONLY | os.O_RDWR | os.O_TRUNC | os.O_APPEND
         )
-        if not is_write and _is_safe_system_path(path_str):
-            return _originals["os_open"](path_str, flags, mode)
+        if (
+            not is_write
+            and path_str.startswith(_SAFE_CACHE_ROOTS)
+            and _is_safe_system_path(path_str)
+        ):
+            return _orig_os_open(path_str, flags, mode)
 
         token = _in_vfs_operation.set(True)
         try:
             return _fd_table.allocate(path_str, fs, flags, mode)
         except (PermissionError, FileNotFoundError):
             if not is_write and _is_safe_system_path(path_str):
-                return _originals["os_open"](path_str, flags, mode)
+                return _orig_os_open(path_str, flags, mode)
             raise
         finally:
             _in_vfs_operation.reset(token)
 
-    return _originals["os_open"](path, flags, mode)
+    return _orig_os_open(path, flags, mode)
 
 
 def _vfs_os_read(fd: int, n: int) -> bytes:
@@ -691,7 +816,7 @@ def _vfs_os_read(fd: int, n: int) -> bytes:
         if not vfd.readable:
             raise OSError(errno.EBADF, "Bad file descriptor")
         return vfd.buffer.read(n) or b""
-    return _originals["os_read"](fd, n)
+    return _orig_os_read(fd, n)
 
 
 def _vfs_os_write(fd: int, data: bytes) -> int:
@@ -700,8 +825,9 @@ def _vfs_os_write(fd: int, data: bytes) -> int:
     if vfd is not None:
         if not vfd.writable:
             raise OSError(errno.EBADF, "Bad file descriptor")
+        vfd.dirty = True
         return vfd.buffer.write(data)
-    return _originals["os_write"](fd, data)
+    return _orig_os_write(fd, data)
 
 
 def _vfs_os_close(fd: int) -> None:
@@ -709,21 +835,20 @@ def _vfs_os_close(fd: int) -> None:
     if _fd_table.is_virtual(fd):
         _fd_table.close(fd)
         return
-    _originals["os_close"](fd)
+    _orig_os_close(fd)
 
 
 def _vfs_os_fstat(fd: int) -> Any:
     """VFS-aware os.fstat() replacement."""
     vfd = _fd_table.get(fd)
     if vfd is not None:
-        size = len(vfd.buffer.getvalue())
+        # Until the buffer is loaded it matches the persisted file
+        size = len(vfd.buffer.getvalue()) if vfd.loaded else None
         try:
             meta = vfd.fs.stat(vfd.path)
             # Override size with current buffer size (may differ from persisted)
-            from ..base import FileMetadata
-
             updated = FileMetadata(
-                size=size,
+                size=meta.size if size is None else size,
                 created_at=meta.created_at,
                 modified_at=meta.modified_at,
                 is_dir=meta.is_dir,
@@ -731,15 +856,11 @@ def _vfs_os_fstat(fd: int) -> Any:
             return _metadata_to_stat_result(updated)
         except FileNotFoundError:
             # File not yet persisted — synthesize minimal stat
-            from datetime import datetime, timezone
-
-            from ..base import FileMetadata
-
             now = datetime.now(timezone.utc).isoformat()
             return _metadata_to_stat_result(
-                FileMetadata(size=size, created_at=now, modified_at=now)
+                FileMetadata(size=size or 0, created_at=now, modified_at=now)
             )
-    return _originals["os_fstat"](fd)
+    return _orig_os_fstat(fd)
 
 
 def _vfs_os_lseek(fd: int, offset: int, whence: int) -> int:
@@ -747,4 +868,4 @@ def _vfs_os_lseek(fd: int, offset: int, whence: int) -> int:
     vfd = _fd_table.get(fd)
     if vfd is not None:
         return vfd.buffer.seek(offset, whence)
-    return _originals["os_lseek"](fd, offset, whence)
+    return _orig_os_lseek(fd, offset, whence)
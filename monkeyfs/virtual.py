@@ -8,7 +8,8 @@ import fnmatch
 import io
 import json
 import os
-from collections.abc import MutableMapping
+import re
+from collections.abc import Iterator, MutableMapping
 from datetime import datetime, timezone
 
 from .base import FileInfo, FileMetadata
@@ -56,7 +57,7 @@ class VirtualFS:
                 None means unlimited.
         """
         self._state = state if state is not None else {}
-        self._dir_cache: set[str] | None = None
+        self._children: dict[str, set[str]] | None = None
         self._metadata_cache: dict[str, FileMetadata] | None = None
         self._max_size_bytes: int | None = (
             max_size_mb * 1024 * 1024 if max_size_mb is not None else None
@@ -95,9 +96,10 @@ class VirtualFS:
         """Return list of paths matching a glob pattern."""
         results = []
         cwd = self.getcwd()
+        absolute = pattern.startswith("/")
 
         # If pattern is absolute, we match against full paths
-        if pattern.startswith("/"):
+        if absolute:
             match_pattern = pattern.lstrip("/")
         else:
             if cwd == "/":
@@ -105,6 +107,14 @@ class VirtualFS:
             else:
                 match_pattern = f"{cwd.lstrip('/')}/{pattern}"
 
+        # Compile once rather than going through fnmatch.fnmatch() per key
+        match = re.compile(fnmatch.translate(match_pattern)).match
+
+        # Results relative to a non-root CWD drop its prefix, e.g. cwd="/src"
+        # turns path="src/main.py" into "main.py"
+        cwd_prefix = "" if absolute or cwd == "/" else cwd.lstrip("/") + "/"
+        prefix_len = len(cwd_prefix)
+
         for key in self._state.keys():
             if (
                 not self._is_vfs_key(key)
@@ -117,22 +127,18 @@ class VirtualFS:
                 key
             )  # normalized path e.g. "src/main.py" (no leading slash)
 
-            # fnmatch against the full relative-to-root path
-            if fnmatch.fnmatch(path, match_pattern):
-                if pattern.startswith("/"):
-                    # Return as absolute path (virtual)
-                    results.append("/" + path)
-                else:
-                    # Return relative to CWD
-                    if cwd == "/":
-                        results.append(path)
-                    elif path.startswith(cwd.lstrip("/") + "/"):
-                        # cwd="/src" -> path="src/main.py"
-                        # cwd.lstrip("/") + "/" -> "src/"
-                        prefix_len = len(cwd.lstrip("/")) + 1
-                        results.append(path[prefix_len:])
+            # Match against the full relative-to-root path
+            if not match(path):
+                continue
+            if absolute:
+                # Return as absolute path (virtual)
+                results.append("/" + path)
+            elif path.startswith(cwd_prefix):
+                # Return relative to CWD
+                results.append(path[prefix_len:])
 
-        return sorted(results)
+        results.sort()
+        return results
 
     def resolve_path(self, path: str) -> str:
         """Resolve path (relative or absolute) against current working directory.
@@ -148,28 +154,83 @@ class VirtualFS:
         cwd = self.getcwd()
         return self._normalize_path(f"{cwd}/{path}")
 
-    def _ensure_dir_cache(self) -> set[str]:
-        """Lazy initialization of directory cache from state keys."""
-        if self._dir_cache is not None:
-            return self._dir_cache
+    def _ensure_children(self) -> dict[str, set[str]]:
+        """Lazy initialization of the directory -> child names index.
+
+        Keys are directory paths without a leading slash ("" for root),
+        built from file keys and explicit directories in metadata. Every
+        key is a directory, so this also serves implicit directory checks.
+        """
+        if self._children is not None:
+            return self._children
+
+        children: dict[str, set[str]] = {"": set()}
+        add = self._add_to_index
 
-        self._dir_cache = {"", "."}  # Root directories
         for key in self._state.keys():
-            if key == self.METADATA_KEY or not self._is_vfs_key(key):
+            if key == self.METADATA_KEY or key == self.CWD_KEY:
+                continue
+            if not self._is_vfs_key(key):
                 continue
-
             try:
                 path = self._decode_path(key)
-                # Add all parent directories
-                parts = path.lstrip("/").split("/")
-                for i in range(len(parts)):
-                    dir_path = "/".join(parts[:i])
-                    self._dir_cache.add(dir_path)
-                    self._dir_cache.add(dir_path + "/")
             except (KeyError, ValueError, UnicodeDecodeError):
                 continue
+            if path.strip("/"):
+                add(children, path)
+
+        for dir_path, meta in self._get_metadata().items():
+            if meta.is_dir and dir_path.strip("/"):
+                add(children, dir_path)
+
+        self._children = children
+        return children
+
+    @staticmethod
+    def _add_to_index(children: dict[str, set[str]], path: str) -> None:
+        """Add path and its parent chain to a children index."""
+        parts = path.strip("/").split("/")
+        for i in range(len(parts)):
+            children.setdefault("/".join(parts[:i]), set()).add(parts[i])
+
+    def _index_add(self, normalized: str) -> None:
+        """Record a new file or directory in the children index, if built."""
+        if self._children is not None and normalized.strip("/"):
+            self._add_to_index(self._children, normalized)
+
+    def _index_discard(self, normalized: str) -> None:
+        """Drop a removed file or empty directory from the children index.
 
-        return self._dir_cache
+        Parents left without children are dropped too, unless they are
+        explicit directories (or also files), matching what a rebuild
+        would produce.
+        Call after the metadata change so explicit directories are current.
+        """
+        children = self._children
+        if children is None:
+            return
+        path = normalized.strip("/")
+        if children.get(path):
+            # Still a directory (state can hold a file and a directory
+            # under the same name), so it stays listed in its parent
+            return
+        children.pop(path, None)
+        metadata = self._get_metadata()
+        while path:
+            parent, _, name = path.rpartition("/")
+            siblings = children.get(parent)
+            if siblings is None:
+                return
+            siblings.discard(name)
+            if siblings or not parent:
+                return
+            meta = metadata.get(parent)
+            if meta is not None and meta.is_dir:
+                return
+            if self._encode_normalized(parent) in self._state:
+                return
+            del children[parent]
+            path = parent
 
     def _now_iso(self) -> str:
         """Get current UTC timestamp as ISO 8601 string with milliseconds."""
@@ -191,28 +252,33 @@ class VirtualFS:
             self._metadata_cache = {}
         else:
             raw = json.loads(metadata_bytes)
-            self._metadata_cache = {
-                path: FileMetadata(**fields) for path, fields in raw.items()
-            }
+            if isinstance(raw, dict):
+                # Legacy format: {path: {field: value}}
+                self._metadata_cache = {
+                    path: FileMetadata(**fields) for path, fields in raw.items()
+                }
+            else:
+                # Rows of [path, size, created_at, modified_at, is_dir]
+                self._metadata_cache = {row[0]: FileMetadata(*row[1:]) for row in raw}
         return self._metadata_cache
 
     def _set_metadata(self, metadata: dict[str, FileMetadata]) -> None:
         """Save metadata dict to state and update the cache.
 
+        Entries are stored as compact rows rather than per-field objects,
+        which keeps the blob small and cheap to (de)serialize.
+
         Args:
             metadata: Dict mapping normalized paths to FileMetadata objects.
         """
         self._metadata_cache = metadata
-        raw = {
-            path: {
-                "size": m.size,
-                "created_at": m.created_at,
-                "modified_at": m.modified_at,
-                "is_dir": m.is_dir,
-            }
+        rows = [
+            [path, m.size, m.created_at, m.modified_at, m.is_dir]
             for path, m in metadata.items()
-        }
-        self._state[self.METADATA_KEY] = json.dumps(raw).encode()
+        ]
+        self._state[self.METADATA_KEY] = json.dumps(
+            rows, separators=(",", ":")
+        ).encode()
 
     def _get_current_size(self) -> int:
         """Get total size of all files in the VFS.
@@ -232,11 +298,11 @@ class VirtualFS:
         )
         return self._current_size
 
-    def _check_size_limit(self, path: str, new_content_size: int) -> None:
+    def _check_size_limit(self, normalized: str, new_content_size: int) -> None:
         """Check if adding content would exceed size limit.
 
         Args:
-            path: File path being written.
+            normalized: Resolved, normalized path of the file being written.
             new_content_size: Size of new content in bytes.
 
         Raises:
@@ -249,7 +315,6 @@ class VirtualFS:
 
         # Account for overwriting existing file
         metadata = self._get_metadata()
-        normalized = self._normalize_path(path)
         existing_size = metadata.get(normalized, FileMetadata(0, "", "")).size
 
         new_total = current - existing_size + new_content_size
@@ -260,21 +325,21 @@ class VirtualFS:
                 f"{self._max_size_bytes / 1024 / 1024:.1f}MB"
             )
 
-    def _update_file_metadata(self, path: str, size: int, is_new: bool) -> None:
+    def _update_file_metadata(
+        self, path: str, size: int, is_new: bool, flush: bool = True
+    ) -> None:
         """Update metadata for a file (create or modify).
 
         Args:
-            path: Normalized file path.
+            path: Resolved, normalized file path (as from resolve_path()).
             size: File size in bytes.
             is_new: True if this is a new file, False if modifying existing.
+            flush: If False, only update the in-memory cache; the caller is
+                responsible for persisting it with _set_metadata().
         """
         metadata = self._get_metadata()
         now = self._now_iso()
 
-        if is_new:
-            # Metadata keys must be normalized to match _encode_path
-            path = self._normalize_path(path)
-
         if is_new or path not in metadata:
             # New file - set both created_at and modified_at
             metadata[path] = FileMetadata(
@@ -290,7 +355,8 @@ class VirtualFS:
                 modified_at=now,
             )
 
-        self._set_metadata(metadata)
+        if flush:
+            self._set_metadata(metadata)
 
     def get_metadata_snapshot(self) -> dict[str, FileMetadata]:
         """Get a copy of current file metadata for change detection.
@@ -336,10 +402,19 @@ class VirtualFS:
         Returns:
             State key (e.g., "__vfs_ONQWIZI...").
         """
-        # Resolve relative paths against CWD first
-        path = self.resolve_path(path)
-        path = self._normalize_path(path)
-        encoded = base64.b32encode(path.encode()).decode().rstrip("=")
+        # Resolve relative paths against CWD first (already normalized)
+        return self._encode_normalized(self.resolve_path(path))
+
+    def _encode_normalized(self, normalized: str) -> str:
+        """Convert an already resolved and normalized path to a state key.
+
+        Args:
+            normalized: Path as returned by resolve_path().
+
+        Returns:
+            State key (e.g., "__vfs_ONQWIZI...").
+        """
+        encoded = base64.b32encode(normalized.encode()).decode().rstrip("=")
         return f"{self.PREFIX}{encoded}"
 
     def _decode_path(self, key: str) -> str:
@@ -378,7 +453,8 @@ class VirtualFS:
             FileNotFoundError: If reading a file that doesn't exist.
             ValueError: If mode is invalid.
         """
-        key = self._encode_path(path)
+        normalized = self.resolve_path(path)
+        key = self._encode_normalized(normalized)
 
         if "r" in mode and "w" not in mode and "a" not in mode and "x" not in mode:
             # Read mode
@@ -393,17 +469,15 @@ class VirtualFS:
 
         elif "w" in mode or "a" in mode or "x" in mode:
             # Write, append, or exclusive creation mode
-            if "x" in mode and self.exists(path):
+            if "x" in mode and self.exists("/" + normalized):
                 raise FileExistsError(f"[Errno 17] File exists: '{path}'")
 
             # Validate parent directory exists (POSIX: open() fails with ENOENT)
-            resolved = self.resolve_path(path)
-            normalized = self._normalize_path(resolved)
             parent = "/".join(normalized.split("/")[:-1])
             if parent and not self.isdir("/" + parent):
                 raise FileNotFoundError(f"No such file or directory: '{path}'")
 
-            return VirtualFile(self, self._state, key, path, mode)
+            return VirtualFile(self, self._state, key, normalized, path, mode)
 
         else:
             raise ValueError(f"Invalid mode: {mode}")
@@ -441,40 +515,55 @@ class VirtualFS:
         if not isinstance(content, bytes):
             raise TypeError(f"Expected bytes, got {type(content).__name__}")
 
+        # Resolve once; the key and metadata entry both derive from this
+        normalized = self.resolve_path(path)
+        self._write_resolved(
+            normalized, self._encode_normalized(normalized), content, mode
+        )
+
+    def _write_resolved(
+        self, normalized: str, key: str, content: bytes, mode: str = "w"
+    ) -> None:
+        """Write bytes to an already resolved path.
+
+        Shared by write() and VirtualFile.close(), which resolves its path
+        once at open time.
+
+        Args:
+            normalized: Resolved, normalized path (as from resolve_path()).
+            key: State key for normalized.
+            content: Content to write.
+            mode: Write mode ('w' for write/overwrite, 'a' for append).
+        """
         # Auto-create parent directories
-        resolved = self.resolve_path(path)
-        normalized = self._normalize_path(resolved)
         parent = "/".join(normalized.split("/")[:-1])
         if parent and not self.isdir("/" + parent):
             self.makedirs("/" + parent)
 
-        key = self._encode_path(path)
-
         # Handle append mode
         if mode == "a":
-            try:
-                existing = self.read(path)
+            existing = self._state.get(key)
+            is_new = existing is None
+            # If file doesn't exist, append behaves like write
+            if existing is not None:
                 content = existing + content
-            except FileNotFoundError:
-                # If file doesn't exist, append behaves like write
-                pass
-        elif mode != "w":
+        elif mode == "w":
+            is_new = key not in self._state
+        else:
             raise ValueError(f"Invalid mode: {mode}")
 
         # Check size limit before writing
-        self._check_size_limit(path, len(content))
-
-        # Check if file exists to determine if this is new or modified
-        is_new = key not in self._state
+        self._check_size_limit(normalized, len(content))
 
         # Write content
         self._state[key] = content
 
         # Update metadata
-        self._update_file_metadata(path, len(content), is_new)
+        self._update_file_metadata(normalized, len(content), is_new)
 
-        # Invalidate caches
-        self._dir_cache = None
+        # Update caches
+        if is_new:
+            self._index_add(normalized)
         self._current_size = None  # Will be recomputed on next access
 
     def write_many(self, files: dict[str, bytes]) -> None:
@@ -507,7 +596,7 @@ class VirtualFS:
             new_total = current
 
             for path, content in files.items():
-                normalized = self._normalize_path(path)
+                normalized = self.resolve_path(path)
                 existing_size = metadata.get(normalized, FileMetadata(0, "", "")).size
                 new_total = new_total - existing_size + len(content)
 
@@ -517,15 +606,22 @@ class VirtualFS:
                     f"{self._max_size_bytes / 1024 / 1024:.1f}MB"
                 )
 
-        # Write all files and update metadata
-        for path, content in files.items():
-            key = self._encode_path(path)
-            is_new = key not in self._state
-            self._state[key] = content
-            self._update_file_metadata(path, len(content), is_new)
+        # Write all files, then persist metadata in a single round-trip
+        try:
+            for path, content in files.items():
+                normalized = self.resolve_path(path)
+                key = self._encode_normalized(normalized)
+                is_new = key not in self._state
+                self._state[key] = content
+                self._update_file_metadata(
+                    normalized, len(content), is_new, flush=False
+                )
+                if is_new:
+                    self._index_add(normalized)
+        finally:
+            self._set_metadata(self._get_metadata())
 
         # Invalidate caches
-        self._dir_cache = None
         self._current_size = None  # Will be recomputed on next access
 
     def list(self, path: str = ".", recursive: bool = False) -> list[str]:
@@ -548,66 +644,65 @@ class VirtualFS:
             raise FileNotFoundError(f"No such directory: '{path}'")
 
         # Resolve path against CWD first, then normalize
-        path = self.resolve_path(path)
-
-        # Adjust logic to match original list expectation (empty string for root)
-        if path == "." or path == "/":
-            path = ""
-        else:
-            path = path + "/"
-
-        results: set[str] = set()
-        for key in self._state.keys():
-            # Skip metadata and CWD keys
-            if key == self.METADATA_KEY or key == self.CWD_KEY:
-                continue
-
-            if not self._is_vfs_key(key):
-                continue
+        path = self.resolve_path(path).strip("/")
+
+        # Files and explicit directories, indexed by parent directory
+        children = self._ensure_children()
+        if not recursive:
+            return sorted(children.get(path, ()))
+
+        # Walk the index below path, collecting paths relative to it
+        results: list[str] = []
+        stack = [(path, "")]
+        while stack:
+            dir_path, rel = stack.pop()
+            for name in children.get(dir_path, ()):
+                child_rel = rel + name
+                results.append(child_rel)
+                stack.append(
+                    (f"{dir_path}/{name}" if dir_path else name, child_rel + "/")
+                )
+        results.sort()
+        return results
 
-            file_path = self._decode_path(key)
-            file_path = file_path.lstrip("/")
+    def list_stat(self, path: str = ".") -> list[tuple[str, FileMetadata]]:
+        """List directory contents together with each entry's metadata.
 
-            if path and not file_path.startswith(path):
-                continue
+        Equivalent to calling stat() on every name from list(), with the
+        metadata loaded once. The patched os.scandir() uses this.
 
-            # Get the remainder after the directory prefix
-            remainder = file_path[len(path) :]
-            if not remainder:
-                continue
+        Args:
+            path: Directory path to list.
 
-            if recursive:
-                # Add all intermediate directory parts too
-                parts = remainder.split("/")
-                for i in range(1, len(parts) + 1):
-                    results.add("/".join(parts[:i]))
-            else:
-                # Get immediate child (first path component)
-                if "/" in remainder:
-                    results.add(remainder.split("/")[0])  # Subdirectory
-                else:
-                    results.add(remainder)  # File
+        Returns:
+            List of (name, FileMetadata) pairs, sorted by name.
 
-        # Include explicit directories from metadata
+        Raises:
+            FileNotFoundError: If the directory doesn't exist.
+            NotADirectoryError: If path is a file.
+        """
+        names = self.list(path)
+        parent = self.resolve_path(path).strip("/")
         metadata = self._get_metadata()
-        for dir_path, meta in metadata.items():
-            if not meta.is_dir:
-                continue
-            dir_path = dir_path.lstrip("/")
-            if path and not dir_path.startswith(path):
-                continue
-            remainder = dir_path[len(path) :]
-            if not remainder:
-                continue
-            if recursive:
-                parts = remainder.split("/")
-                for i in range(1, len(parts) + 1):
-                    results.add("/".join(parts[:i]))
-            else:
-                child = remainder.split("/")[0]
-                results.add(child)
+        now = self._now_iso()
 
-        return sorted(results)
+        results = []
+        for name in names:
+            normalized = f"{parent}/{name}" if parent else name
+            meta = metadata.get(normalized)
+            if meta is None:
+                # Only files and implicit directories lack stored metadata
+                content = self._state.get(self._encode_normalized(normalized))
+                if content is not None:
+                    meta = FileMetadata(
+                        size=len(content), created_at=now, modified_at=now
+                    )
+                else:
+                    meta = FileMetadata(
+                        size=0, created_at=now, modified_at=now, is_dir=True
+                    )
+            results.append((name, meta))
+        return results
 
     def exists(self, path: str) -> bool:
         """Check if a file or directory exists.
@@ -621,23 +716,19 @@ class VirtualFS:
         Returns:
             True if path exists, False otherwise.
         """
+        normalized = self.resolve_path(path)
+
         # Check for exact file match
-        key = self._encode_path(path)
-        if key in self._state:
+        if self._encode_normalized(normalized) in self._state:
             return True
 
         # Check for explicit directory entry in metadata
-        resolved = self.resolve_path(path)
-        normalized = self._normalize_path(resolved)
         metadata = self._get_metadata()
         if normalized in metadata and metadata[normalized].is_dir:
             return True
 
         # Check for implicit directory match (backward compat)
-        if normalized == "/":
-            normalized = ""
-        cache = self._ensure_dir_cache()
-        return normalized in cache or (normalized + "/") in cache
+        return normalized.strip("/") in self._ensure_children()
 
     def isfile(self, path: str) -> bool:
         """Check if path is a file.
@@ -664,8 +755,7 @@ class VirtualFS:
             True if path is a directory, False otherwise.
         """
         # Resolve path against CWD first
-        path = self.resolve_path(path)
-        normalized = self._normalize_path(path)
+        normalized = self.resolve_path(path)
 
         # Root is always a directory
         if normalized in ("", "/"):
@@ -677,8 +767,7 @@ class VirtualFS:
             return True
 
         # Fall back to implicit detection (for backward compatibility)
-        cache = self._ensure_dir_cache()
-        return normalized in cache or (normalized + "/") in cache
+        return normalized.strip("/") in self._ensure_children()
 
     def islink(self, path: str) -> bool:
         """Check if path is a symbolic link.
@@ -759,19 +848,19 @@ class VirtualFS:
         Raises:
             FileNotFoundError: If file doesn't exist.
         """
-        key = self._encode_path(path)
+        normalized = self.resolve_path(path)
+        key = self._encode_normalized(normalized)
         if key not in self._state:
             raise FileNotFoundError(path)
         del self._state[key]
 
         # Remove from metadata
-        path = self._normalize_path(path)
         metadata = self._get_metadata()
-        metadata.pop(path, None)
+        metadata.pop(normalized, None)
         self._set_metadata(metadata)
 
-        # Invalidate caches
-        self._dir_cache = None
+        # Update caches
+        self._index_discard(normalized)
         self._current_size = None  # Will be recomputed on next access
 
     def remove_many(self, paths: list[str]) -> None:
@@ -784,20 +873,24 @@ class VirtualFS:
             FileNotFoundError: If a file doesn't exist.
         """
         # Delete from backing state
+        removed = []
         for path in paths:
-            key = self._encode_path(path)
+            normalized = self.resolve_path(path)
+            key = self._encode_normalized(normalized)
             if key not in self._state:
                 raise FileNotFoundError(path)
             del self._state[key]
+            removed.append(normalized)
 
         # Single metadata round-trip
         metadata = self._get_metadata()
-        for path in paths:
-            metadata.pop(self._normalize_path(path), None)
+        for normalized in removed:
+            metadata.pop(normalized, None)
         self._set_metadata(metadata)
 
-        # Invalidate caches
-        self._dir_cache = None
+        # Update caches
+        for normalized in removed:
+            self._index_discard(normalized)
         self._current_size = None
 
     def mkdir(
@@ -822,8 +915,8 @@ class VirtualFS:
             self.makedirs(path, exist_ok=exist_ok)
             return
 
-        path = self.resolve_path(path)
-        normalized = self._normalize_path(path)
+        normalized = self.resolve_path(path)
+        path = "/" + normalized.lstrip("/")
 
         # Validate parent exists
         parent = "/".join(normalized.split("/")[:-1])
@@ -848,7 +941,7 @@ class VirtualFS:
             is_dir=True,
         )
         self._set_metadata(metadata)
-        self._dir_cache = None  # Invalidate cache
+        self._index_add(normalized)
 
     def makedirs(self, path: str, exist_ok: bool = True) -> None:
         """Create directory tree.
@@ -865,13 +958,29 @@ class VirtualFS:
         path = self.resolve_path(path)
         parts = path.strip("/").split("/")
 
-        # Create each parent directory
-        for i in range(len(parts)):
-            dir_path = "/" + "/".join(parts[: i + 1])
-            if self.isfile(dir_path):
-                raise FileExistsError(f"File exists: {dir_path}")
-            if not self.isdir(dir_path):
-                self.mkdir(dir_path, exist_ok=True)
+        # Create each missing directory in the cached metadata, then persist
+        # once for the whole tree rather than once per level.
+        metadata = self._get_metadata()
+        now = self._now_iso()
+        created: str | None = None
+        try:
+            for i in range(len(parts)):
+                dir_path = "/" + "/".join(parts[: i + 1])
+                if self.isfile(dir_path):
+                    raise FileExistsError(f"File exists: {dir_path}")
+                if not self.isdir(dir_path):
+                    metadata[self._normalize_path(dir_path)] = FileMetadata(
+                        size=0,
+                        created_at=now,
+                        modified_at=now,
+                        is_dir=True,
+                    )
+                    created = dir_path
+        finally:
+            if created:
+                self._set_metadata(metadata)
+                # Indexing the deepest new directory adds its parents too
+                self._index_add(created)
 
     def rmdir(self, path: str) -> None:
         """Remove an empty directory.
@@ -884,8 +993,8 @@ class VirtualFS:
             NotADirectoryError: If path is a file.
             OSError: If directory is not empty.
         """
-        path = self.resolve_path(path)
-        normalized = self._normalize_path(path)
+        normalized = self.resolve_path(path)
+        path = "/" + normalized.lstrip("/")
 
         if not self.exists(path):
             raise FileNotFoundError(f"No such directory: {path}")
@@ -894,16 +1003,16 @@ class VirtualFS:
         if not self.isdir(path):
             raise FileNotFoundError(f"No such directory: {path}")
 
-        # Check if directory is empty
-        children = self.list(path)
-        if children:
+        # Check if directory is empty (an index lookup, without list()
+        # re-checking the path and sorting the names)
+        if self._ensure_children().get(normalized.strip("/")):
             raise OSError(f"Directory not empty: {path}")
 
         # Remove directory metadata
         metadata = self._get_metadata()
         metadata.pop(normalized, None)
         self._set_metadata(metadata)
-        self._dir_cache = None
+        self._index_discard(normalized)
 
     def rename(self, src: str, dst: str) -> None:
         """Rename/move a file or directory.
@@ -915,18 +1024,19 @@ class VirtualFS:
         Raises:
             FileNotFoundError: If source doesn't exist.
         """
-        src_resolved = self.resolve_path(src)
-        dst_resolved = self.resolve_path(dst)
-        src_norm = self._normalize_path(src_resolved)
-        dst_norm = self._normalize_path(dst_resolved)
-
-        if self.isfile(src):
-            # File rename
-            content = self.read(src)
+        src_norm = self.resolve_path(src)
+        dst_norm = self.resolve_path(dst)
+
+        src_key = self._encode_normalized(src_norm)
+        content = self._state.get(src_key)
+        if content is not None:
+            # File rename, working from the keys resolved above
+            if src_norm == dst_norm:
+                return
             metadata = self._get_metadata()
             src_meta = metadata.get(src_norm)
 
-            self.write(dst, content)
+            self._write_resolved(dst_norm, self._encode_normalized(dst_norm), content)
 
             # Preserve created_at from source
             metadata = self._get_metadata()
@@ -937,23 +1047,25 @@ class VirtualFS:
                     created_at=src_meta.created_at,
                     modified_at=dst_meta.modified_at,
                 )
-                self._set_metadata(metadata)
 
-            self.remove(src)
+            # Drop the source and persist both metadata changes at once
+            del self._state[src_key]
+            metadata.pop(src_norm, None)
+            self._set_metadata(metadata)
+            self._children = None
+            self._current_size = None
 
         elif self.isdir(src):
             # Directory rename — move all children
             src_prefix = src_norm.rstrip("/") + "/"
 
-            # Collect all files under src
+            # Collect all files under src from the children index, instead
+            # of decoding every key in state
             files_to_move = []
-            for key in list(self._state.keys()):
-                if not self._is_vfs_key(key):
-                    continue
-                if key == self.METADATA_KEY or key == self.CWD_KEY:
-                    continue
-                file_path = self._decode_path(key).lstrip("/")
-                if file_path == src_norm or file_path.startswith(src_prefix):
+            for rel in self.list(src, recursive=True):
+                file_path = src_prefix + rel
+                key = self._encode_normalized(file_path)
+                if key in self._state:
                     files_to_move.append((key, file_path))
 
             metadata = self._get_metadata()
@@ -979,7 +1091,7 @@ class VirtualFS:
                 metadata[dst_norm + rel] = metadata.pop(k)
 
             self._set_metadata(metadata)
-            self._dir_cache = None
+            self._children = None
         else:
             raise FileNotFoundError(src)
 
@@ -1036,20 +1148,19 @@ class VirtualFS:
             >>> print(f"Size: {meta.size} bytes")
             >>> print(f"Created: {meta.created_at}")
         """
+        normalized = self.resolve_path(path)
+
         # Check for file first
-        if self.isfile(path):
-            path = self._normalize_path(path)
+        content = self._state.get(self._encode_normalized(normalized))
+        if content is not None:
             metadata = self._get_metadata()
-            if path in metadata:
-                return metadata[path]
+            if normalized in metadata:
+                return metadata[normalized]
             now = datetime.now(timezone.utc).isoformat()
-            return FileMetadata(
-                size=self.getsize(path), created_at=now, modified_at=now
-            )
+            return FileMetadata(size=len(content), created_at=now, modified_at=now)
 
         # Check for directory
-        if self.isdir(path):
-            normalized = self._normalize_path(path)
+        if self.isdir("/" + normalized):
             metadata = self._get_metadata()
             if normalized in metadata:
                 return metadata[normalized]
@@ -1075,7 +1186,7 @@ class VirtualFS:
         if not self.exists(path):
             raise FileNotFoundError(path)
 
-        path = self._normalize_path(path)
+        path = self.resolve_path(path)
         metadata = self._get_metadata()
 
         if times is not None:
@@ -1096,7 +1207,7 @@ class VirtualFS:
                 size=0,
                 created_at=mtime,
                 modified_at=mtime,
-                is_dir=self.isdir(path),
+                is_dir=self.isdir("/" + path),
             )
 
         self._set_metadata(metadata)
@@ -1119,6 +1230,27 @@ class VirtualFS:
             >>> for f in files:
             ...     print(f"{f.name:20} {f.size:>10} {f.modified_at}")
         """
+        return list(self.iter_list_detailed(path, recursive=recursive))
+
+    def iter_list_detailed(
+        self, path: str = ".", recursive: bool = False
+    ) -> Iterator[FileInfo]:
+        """Iterate over directory contents with full file metadata.
+
+        Like list_detailed(), but FileInfo objects are built as the caller
+        consumes them, so stopping early skips the remaining lookups.
+
+        Args:
+            path: Directory path to list (default: root).
+            recursive: If True, include all nested files and directories.
+
+        Returns:
+            Iterator of FileInfo objects sorted by name.
+
+        Raises:
+            FileNotFoundError: If the directory doesn't exist.
+            NotADirectoryError: If path is a file.
+        """
         # Get file list from existing list() method
         names = self.list(path, recursive=recursive)
         user_prefix = path.rstrip("/")
@@ -1134,38 +1266,37 @@ class VirtualFS:
         # Load all metadata once
         all_metadata = self._get_metadata()
 
-        # Build FileInfo objects
-        result = []
-        for name in names:
-            # Internal key for metadata / isdir lookups
-            if not normalized_path:
-                internal_path = name
-            else:
-                internal_path = f"{normalized_path}/{name}"
+        # Entries without stored metadata share a single timestamp string
+        now = self._now_iso()
+
+        def entries() -> Iterator[FileInfo]:
+            for name in names:
+                # Internal key for metadata / isdir lookups
+                if not normalized_path:
+                    internal_path = name
+                else:
+                    internal_path = f"{normalized_path}/{name}"
 
-            # Display path preserves the user's queried prefix
-            display = f"{user_prefix}/{name}" if user_prefix != "." else name
+                # Display path preserves the user's queried prefix
+                display = f"{user_prefix}/{name}" if user_prefix != "." else name
 
-            # Check if it's a directory
-            is_dir = self.isdir(internal_path)
+                # Check if it's a directory
+                is_dir = self.isdir(internal_path)
 
-            if is_dir:
-                result.append(
-                    FileInfo(
+                if is_dir:
+                    yield FileInfo(
                         name=name,
                         path=display,
                         size=0,
-                        created_at=self._now_iso(),
-                        modified_at=self._now_iso(),
+                        created_at=now,
+                        modified_at=now,
                         is_dir=True,
                     )
-                )
-            else:
-                # File - get metadata
-                meta = all_metadata.get(internal_path)
-                if meta:
-                    result.append(
-                        FileInfo(
+                else:
+                    # File - get metadata
+                    meta = all_metadata.get(internal_path)
+                    if meta:
+                        yield FileInfo(
                             name=name,
                             path=display,
                             size=meta.size,
@@ -1173,13 +1304,10 @@ class VirtualFS:
                             modified_at=meta.modified_at,
                             is_dir=False,
                         )
-                    )
-                else:
-                    # File exists but has no metadata
-                    content = self.read(internal_path)
-                    now = self._now_iso()
-                    result.append(
-                        FileInfo(
+                    else:
+                        # File exists but has no metadata
+                        content = self.read(internal_path)
+                        yield FileInfo(
                             name=name,
                             path=display,
                             size=len(content),
@@ -1187,6 +1315,5 @@ class VirtualFS:
                             modified_at=now,
                             is_dir=False,
                         )
-                    )
 
-        return result
+        return entries()
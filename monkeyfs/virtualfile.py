@@ -26,6 +26,7 @@ class VirtualFile:
         vfs: "VirtualFS",
         state: MutableMapping[str, bytes],
         key: str,
+        normalized: str,
         path: str,
         mode: str,
     ):
@@ -35,12 +36,14 @@ class VirtualFile:
             vfs: The VirtualFS instance for metadata tracking.
             state: State backend for persistence.
             key: Encoded state key for this file.
+            normalized: Path resolved against the CWD at open time.
             path: Original file path (for error messages).
             mode: File open mode.
         """
         self._vfs = vfs
         self._state = state
         self._key = key
+        self._normalized = normalized
         self._path = path
         self._mode = mode
         self._closed = False
@@ -111,8 +114,9 @@ class VirtualFile:
         if isinstance(content, str):
             content = content.encode("utf-8")
 
-        # Use VFS write to get proper metadata tracking
-        self._vfs.write(self._path, content)
+        # Write to the path resolved at open time (a later chdir() must not
+        # redirect it), with the VFS's usual metadata tracking
+        self._vfs._write_resolved(self._normalized, self._key, content)
 
         self._closed = True
 
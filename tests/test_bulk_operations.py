@@ -91,3 +91,21 @@ class TestBulkOperations:
 
         # Should not raise
         vfs.remove_many([])
+
+    def test_write_many_persists_metadata_once(self):
+        """Test that write_many serializes metadata once for the whole batch."""
+
+        class CountingState(dict):
+            metadata_writes = 0
+
+            def __setitem__(self, key, value):
+                if key == VirtualFS.METADATA_KEY:
+                    CountingState.metadata_writes += 1
+                super().__setitem__(key, value)
+
+        state = CountingState()
+        vfs = VirtualFS(state)
+        vfs.write_many({f"file{i}.txt": b"x" * i for i in range(10)})
+
+        assert CountingState.metadata_writes == 1
+        assert VirtualFS(dict(state)).stat("file9.txt").size == 9
@@ -0,0 +1,235 @@
+"""Tests for CachedFS wrapper."""
+
+import os
+import threading
+
+import pytest
+
+from monkeyfs import CachedFS, IsolatedFS, VirtualFS, patch
+
+
+class CountingFS(VirtualFS):
+    """VirtualFS that counts lookups reaching the backend."""
+
+    def __init__(self, state=None):
+        super().__init__(state)
+        self.calls = 0
+
+    def stat(self, path):
+        self.calls += 1
+        return super().stat(path)
+
+    def exists(self, path):
+        self.calls += 1
+        return super().exists(path)
+
+    def realpath(self, path):
+        self.calls += 1
+        return super().realpath(path)
+
+
+class TestCachedLookups:
+    """Test that lookups are served from the cache."""
+
+    def test_stat_cached(self):
+        """Test that repeated stat() hits the backend once."""
+        vfs = CountingFS({})
+        vfs.write("a.txt", b"hello")
+        fs = CachedFS(vfs)
+
+        assert fs.stat("a.txt").size == 5
+        assert fs.stat("a.txt").size == 5
+        assert vfs.calls == 1
+
+    def test_missing_path_cached(self):
+        """Test that FileNotFoundError results are cached too."""
+        vfs = CountingFS({})
+        fs = CachedFS(vfs)
+
+        for _ in range(3):
+            assert fs.exists("missing.txt") is False
+            with pytest.raises(FileNotFoundError):
+                fs.stat("missing.txt")
+        assert vfs.calls == 2
+
+    def test_checks_answered_from_cached_stat(self):
+        """Test that exists/isfile/isdir reuse an earlier stat() result."""
+        vfs = CountingFS({})
+        vfs.write("d/a.txt", b"hello")
+        fs = CachedFS(vfs)
+
+        fs.stat("d/a.txt")
+        fs.stat("d")
+        with pytest.raises(FileNotFoundError):
+            fs.stat("missing.txt")
+        assert vfs.calls == 3
+
+        assert fs.exists("d/a.txt") is True
+        assert fs.isfile("d/a.txt") is True
+        assert fs.isdir("d/a.txt") is False
+        assert fs.isfile("d") is False
+        assert fs.isdir("d") is True
+        assert fs.exists("missing.txt") is False
+        assert fs.isfile("missing.txt") is False
+        assert vfs.calls == 3
+
+    def test_relative_paths_keyed_by_cwd(self):
+        """Test that the same relative path under a different CWD is a miss."""
+        vfs = VirtualFS({})
+        vfs.write("a/x.txt", b"1")
+        vfs.write("b/y.txt", b"2")
+        fs = CachedFS(vfs)
+
+        fs.chdir("/a")
+        assert fs.exists("x.txt") is True
+        fs.chdir("/b")
+        assert fs.exists("x.txt") is False
+
+    def test_realpath_cached(self):
+        """Test that repeated realpath() hits the backend once."""
+        vfs = CountingFS({})
+        fs = CachedFS(vfs)
+
+        assert fs.realpath("a/../b.txt") == "/b.txt"
+        assert fs.realpath("a/../b.txt") == "/b.txt"
+        assert vfs.calls == 1
+
+    def test_maxsize_evicts_oldest(self):
+        """Test that the cache is bounded."""
+        vfs = CountingFS({})
+        fs = CachedFS(vfs, maxsize=2)
+
+        fs.exists("a")
+        fs.exists("b")
+        fs.exists("c")  # evicts "a"
+        fs.exists("a")
+        assert vfs.calls == 4
+
+
+class TestCachedInvalidation:
+    """Test that mutations are reflected in later lookups."""
+
+    def test_write_clears_negative_entry(self):
+        """Test that writing a file makes a cached-missing path visible."""
+        fs = CachedFS(VirtualFS({}))
+        assert fs.exists("new.txt") is False
+
+        fs.write("new.txt", b"data")
+        assert fs.exists("new.txt") is True
+
+    def test_remove_and_rename(self):
+        """Test that remove and rename invalidate cached results."""
+        vfs = VirtualFS({})
+        vfs.write("a.txt", b"data")
+        fs = CachedFS(vfs)
+        assert fs.isfile("a.txt") is True
+
+        fs.rename("a.txt", "b.txt")
+        assert fs.isfile("a.txt") is False
+        assert fs.isfile("b.txt") is True
+
+        fs.remove("b.txt")
+        assert fs.exists("b.txt") is False
+
+    def test_symlink_changes_realpath(self, tmp_path):
+        """Test that creating a symlink is reflected in a cached realpath."""
+        (tmp_path / "target").mkdir()
+        fs = CachedFS(IsolatedFS(root=str(tmp_path)))
+        assert fs.realpath("link") == "/link"
+
+        fs.symlink("/target", "link")
+        assert fs.realpath("link") == "/target"
+
+    def test_open_for_write_bypasses_cache_until_closed(self):
+        """Test that lookups see content written through an open handle."""
+        fs = CachedFS(VirtualFS({}))
+
+        f = fs.open("out.txt", "w")
+        assert fs.exists("out.txt") is False  # not persisted until close
+        f.write("hello")
+        f.close()
+
+        assert fs.exists("out.txt") is True
+        assert fs.stat("out.txt").size == 5
+
+    def test_invalidate_and_clear(self):
+        """Test manual invalidation after external changes."""
+        vfs = VirtualFS({})
+        fs = CachedFS(vfs)
+        assert fs.exists("a.txt") is False
+
+        vfs.write("a.txt", b"x")  # bypasses the wrapper
+        assert fs.exists("a.txt") is False
+        fs.invalidate("a.txt")
+        assert fs.exists("a.txt") is True
+
+        vfs.remove("a.txt")
+        fs.clear_cache()
+        assert fs.exists("a.txt") is False
+
+    def test_chmod_and_chown_clear_cache(self):
+        """Test that permission changes made through the wrapper invalidate."""
+        vfs = CountingFS({})
+        vfs.write("a.txt", b"x")
+        fs = CachedFS(vfs)
+
+        fs.stat("a.txt")
+        fs.chmod("a.txt", 0o600)
+        vfs.calls = 0
+        fs.stat("a.txt")
+        assert vfs.calls == 1
+
+        fs.chown("a.txt", 0, 0)
+        vfs.calls = 0
+        fs.stat("a.txt")
+        assert vfs.calls == 1
+
+    def test_concurrent_lookups_and_clears(self):
+        """Test that lookups racing with mutations neither fail nor go stale."""
+        vfs = VirtualFS({})
+        fs = CachedFS(vfs, maxsize=8)
+        errors = []
+
+        def probe():
+            try:
+                for i in range(2000):
+                    fs.exists(f"f{i % 32}.txt")
+            except Exception as e:  # pragma: no cover - failure path
+                errors.append(e)
+
+        threads = [threading.Thread(target=probe) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for i in range(200):
+            fs.write(f"f{i % 32}.txt", b"x")
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert all(fs.exists(f"f{i}.txt") for i in range(32))
+
+    def test_read_operations_delegate(self):
+        """Test that uncached operations pass through to the wrapped fs."""
+        vfs = VirtualFS({})
+        vfs.write("a.txt", b"data")
+        fs = CachedFS(vfs)
+
+        assert fs.read("a.txt") == b"data"
+        assert fs.list("/") == ["a.txt"]
+
+
+class TestCachedPatching:
+    """Test CachedFS under patch()."""
+
+    def test_patched_file_roundtrip(self):
+        """Test that patched stdlib calls see writes made under the cache."""
+        fs = CachedFS(VirtualFS({}))
+
+        with patch(fs):
+            assert not os.path.exists("data.txt")
+            with open("data.txt", "w") as f:
+                f.write("abc")
+            assert os.path.exists("data.txt")
+            assert os.path.getsize("data.txt") == 3
+            os.remove("data.txt")
+            assert not os.path.exists("data.txt")
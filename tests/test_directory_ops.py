@@ -271,6 +271,58 @@ class TestVFSCwdPathResolution:
 
         assert not vfs.exists("/mydir/file.txt")
 
+    def test_stat_respects_cwd(self):
+        """Metadata written under a CWD is found by absolute path."""
+        vfs = VirtualFS({})
+
+        vfs.mkdir("mydir")
+        vfs.chdir("mydir")
+        vfs.write("file.txt", b"content")
+        created = vfs.stat("file.txt").created_at
+        vfs.chdir("/")
+
+        meta = vfs.stat("/mydir/file.txt")
+        assert meta.size == 7
+        assert meta.created_at == created
+        assert "file.txt" not in vfs.get_metadata_snapshot()
+
+    def test_remove_under_cwd_drops_metadata(self):
+        """remove under a CWD deletes the file's metadata entry."""
+        vfs = VirtualFS({})
+
+        vfs.write("mydir/file.txt", b"content")
+        vfs.chdir("mydir")
+        vfs.remove("file.txt")
+
+        assert "mydir/file.txt" not in vfs.get_metadata_snapshot()
+
+    def test_open_file_keeps_path_across_chdir(self):
+        """A file opened for writing is saved where it was opened."""
+        vfs = VirtualFS({})
+
+        vfs.mkdir("mydir")
+        vfs.chdir("mydir")
+        f = vfs.open("file.txt", "w")
+        f.write("content")
+        vfs.chdir("/")
+        f.close()
+
+        assert vfs.read("/mydir/file.txt") == b"content"
+        assert not vfs.exists("/file.txt")
+        assert vfs.stat("/mydir/file.txt").size == 7
+
+    def test_mkdir_rmdir_respect_cwd(self):
+        """mkdir and rmdir resolve relative paths against CWD once."""
+        vfs = VirtualFS({})
+
+        vfs.mkdir("mydir")
+        vfs.chdir("mydir")
+        vfs.mkdir("sub")
+        assert vfs.isdir("/mydir/sub")
+
+        vfs.rmdir("sub")
+        assert not vfs.exists("/mydir/sub")
+
 
 class TestVFSOsPatches:
     """Test that os.* patched functions respect CWD."""
@@ -323,6 +375,20 @@ class TestVFSOsPatches:
             assert os.path.abspath("file.txt") == "/mydir/file.txt"
             assert os.path.abspath("../other.txt") == "/other.txt"
 
+    def test_os_path_abspath_absolute_paths(self):
+        """os.path.abspath normalizes absolute paths regardless of CWD."""
+        vfs = VirtualFS({})
+        vfs.makedirs("mydir")
+
+        with patch(vfs):
+            os.chdir("mydir")
+            assert os.path.abspath("/a/b.txt") == "/a/b.txt"
+            assert os.path.abspath("/a/.cache/b") == "/a/.cache/b"
+            assert os.path.abspath("/a//b/") == "/a/b"
+            assert os.path.abspath("/a/./b/../c") == "/a/c"
+            assert os.path.abspath("/a/..") == "/"
+            assert os.path.abspath("/") == "/"
+
 
 class TestAutoCreateParentDirs:
     """Test auto-creation of parent directories on file write."""
@@ -395,3 +461,48 @@ class TestImplicitDirectories:
         assert vfs.list("/") == ["pkg", "top.py"]
         assert vfs.list("pkg") == ["__init__.py", "sub", "utils.py"]
         assert vfs.list("pkg/sub") == ["mod.py"]
+
+    def test_list_follows_mutations(self):
+        """Listings stay current as files and directories change."""
+        vfs = VirtualFS({})
+
+        vfs.write("pkg/a.py", b"")
+        assert vfs.list("pkg") == ["a.py"]
+
+        vfs.write("pkg/b.py", b"")
+        vfs.mkdir("pkg/empty")
+        assert vfs.list("pkg") == ["a.py", "b.py", "empty"]
+
+        vfs.remove("pkg/a.py")
+        vfs.rmdir("pkg/empty")
+        assert vfs.list("pkg") == ["b.py"]
+
+        vfs.rename("pkg", "lib")
+        assert vfs.list("/") == ["lib"]
+        assert vfs.list("/", recursive=True) == ["lib", "lib/b.py"]
+
+    def test_removing_last_file_drops_implicit_parents(self):
+        """Emptied implicit directories disappear; explicit ones remain."""
+        vfs = VirtualFS({})
+        vfs.makedirs("keep")
+        # write_many() leaves parent directories implicit
+        vfs.write_many({"keep/a/b/c.txt": b""})
+        vfs.list("/")
+
+        vfs.remove("keep/a/b/c.txt")
+        assert vfs.list("/") == ["keep"]
+        assert vfs.list("keep") == []
+        assert not vfs.isdir("keep/a")
+        assert vfs.isdir("keep")
+
+    def test_failed_makedirs_leaves_files_alone(self):
+        """A makedirs that hits a file does not turn the file into a directory."""
+        vfs = VirtualFS({})
+        vfs.write("f.txt", b"")
+        vfs.list("/")
+
+        with pytest.raises(FileExistsError):
+            vfs.makedirs("f.txt/sub")
+        assert vfs.isfile("f.txt")
+        assert not vfs.isdir("f.txt")
+        assert vfs.list("/") == ["f.txt"]
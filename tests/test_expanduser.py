@@ -94,6 +94,8 @@ def test_expandvars_vfs():
         assert os.path.expandvars("$HOME/.bashrc") == "/.bashrc"
         # Mixed variables - $HOME should be replaced but other vars pass through
         assert os.path.expandvars("$HOME/bin:$PATH").startswith("/bin:")
+        # Paths without variables come back unchanged
+        assert os.path.expandvars("data/HOME/file.txt") == "data/HOME/file.txt"
 
 
 def test_expandvars_isolated():
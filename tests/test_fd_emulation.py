@@ -154,6 +154,21 @@ class TestFdopen:
             with os.fdopen(fd, "r") as f:
                 assert f.read() == "read text"
 
+    def test_fdopen_unbuffered_buffer_objects(self):
+        vfs = VirtualFS({})
+        with patch(vfs):
+            fd = os.open("/test.txt", os.O_RDWR | os.O_CREAT, 0o600)
+            with os.fdopen(fd, "r+b", buffering=0) as f:
+                f.write(memoryview(b"abc"))
+                f.write(bytearray(b"def"))
+                f.seek(0)
+                buf = bytearray(4)
+                assert f.readinto(buf) == 4
+                assert buf == b"abcd"
+                assert f.readinto(buf) == 2
+                assert buf[:2] == b"ef"
+        assert vfs.read("/test.txt") == b"abcdef"
+
 
 class TestTempfileIntegration:
     def test_mkstemp(self):
@@ -282,6 +297,56 @@ class TestEdgeCases:
             assert st.st_size == len(b"short and longer")
             os.close(fd)
 
+    def test_content_loaded_on_first_use(self):
+        """fstat/close on an untouched fd should not read the file."""
+        vfs = VirtualFS({})
+        vfs.write("/test.txt", b"hello")
+        reads = []
+        vfs.read = lambda path: reads.append(path) or VirtualFS.read(vfs, path)
+        with patch(vfs):
+            fd = os.open("/test.txt", os.O_RDWR)
+            assert os.fstat(fd).st_size == 5
+            os.close(fd)
+            assert reads == []
+
+            fd = os.open("/test.txt", os.O_WRONLY)
+            os.write(fd, b"J")
+            os.close(fd)
+            assert len(reads) == 1
+        assert vfs.read("/test.txt") == b"Jello"
+
+    def test_os_open_rdonly_system_path_passes_through(self):
+        with open(os.__file__, "rb") as f:
+            expected = f.read(64)
+        with patch(VirtualFS({})):
+            fd = os.open(os.__file__, os.O_RDONLY)
+            try:
+                assert fd < 10_000
+                assert os.read(fd, 64) == expected
+            finally:
+                os.close(fd)
+            with pytest.raises(FileNotFoundError):
+                os.open(os.__file__, os.O_WRONLY)
+
+    def test_close_writes_back_only_changes(self):
+        vfs = VirtualFS({})
+        vfs.write("/test.txt", b"hello")
+        vfs.write("/trunc.txt", b"old")
+        writes = []
+        vfs.write = lambda path, content: (
+            writes.append(path) or VirtualFS.write(vfs, path, content)
+        )
+        with patch(vfs):
+            fd = os.open("/test.txt", os.O_RDWR)
+            assert os.read(fd, 100) == b"hello"
+            os.close(fd)
+            assert writes == []
+
+            fd = os.open("/trunc.txt", os.O_WRONLY | os.O_TRUNC)
+            os.close(fd)
+        assert len(writes) == 1
+        assert vfs.read("/trunc.txt") == b""
+
     def test_lseek_seek_end(self):
         vfs = VirtualFS({})
         with patch(vfs):
@@ -0,0 +1,39 @@
+"""Tests for the package's lazy top-level exports."""
+
+import subprocess
+import sys
+
+import monkeyfs
+
+
+def test_import_loads_no_submodules():
+    """Test that importing monkeyfs defers loading its submodules."""
+    code = (
+        "import sys, monkeyfs; "
+        "print(sorted(m for m in sys.modules if m.startswith('monkeyfs.')))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "[]"
+
+
+def test_all_exports_resolve():
+    """Test that every name in __all__ resolves to its submodule object."""
+    from monkeyfs.patching import patch
+    from monkeyfs.virtual import VirtualFS
+
+    for name in monkeyfs.__all__:
+        assert getattr(monkeyfs, name) is not None
+    assert monkeyfs.VirtualFS is VirtualFS
+    assert monkeyfs.patch is patch
+    assert set(monkeyfs.__all__) <= set(dir(monkeyfs))
+
+
+def test_unknown_attribute_raises():
+    """Test that unknown attributes raise AttributeError."""
+    try:
+        monkeyfs.DoesNotExist
+        assert False, "Should have raised AttributeError"
+    except AttributeError:
+        pass
@@ -29,6 +29,28 @@ class TestIsolatedCoreReadWrite:
         assert fs.isdir("a") is True
         assert fs.isdir("a/b") is True
 
+    def test_write_recreates_parent_removed_externally(self, tmp_path):
+        """Test that write recreates a parent deleted outside the FS."""
+        fs = IsolatedFS(str(tmp_path))
+        fs.write("a/b/one.txt", b"1")
+        (tmp_path / "a" / "b" / "one.txt").unlink()
+        (tmp_path / "a" / "b").rmdir()
+        fs.write("a/b/two.txt", b"2")
+        assert fs.read("a/b/two.txt") == b"2"
+
+    def test_write_after_rmdir_and_rename(self, tmp_path):
+        """Test that write recreates parents removed or moved through the FS."""
+        fs = IsolatedFS(str(tmp_path))
+        fs.write("a/x.txt", b"x")
+        fs.remove("a/x.txt")
+        fs.rmdir("a")
+        fs.write("a/y.txt", b"y")
+        fs.rename("a", "b")
+        fs.write("a/z.txt", b"z")
+        assert fs.list("/", recursive=True) == sorted(
+            ["a", os.path.join("a", "z.txt"), "b", os.path.join("b", "y.txt")]
+        )
+
     def test_write_append(self, tmp_path):
         """Test that write with mode='a' appends content."""
         fs = IsolatedFS(str(tmp_path))
@@ -56,6 +78,21 @@ class TestIsolatedCoreReadWrite:
         assert fs.read("b.txt") == b"bravo"
         assert fs.read("c.txt") == b"charlie"
 
+    def test_write_many_nested(self, tmp_path):
+        """Test that write_many creates parents shared by several files."""
+        fs = IsolatedFS(str(tmp_path))
+        fs.write_many({"pkg/a.py": b"a", "pkg/b.py": b"b", "pkg/sub/c.py": b"c"})
+        assert fs.list("pkg") == ["a.py", "b.py", "sub"]
+        assert fs.read("pkg/sub/c.py") == b"c"
+
+    def test_write_many_escape_writes_nothing(self, tmp_path):
+        """Test that an escaping path is rejected before any file is written."""
+        fs = IsolatedFS(str(tmp_path / "root"))
+        with pytest.raises(PermissionError):
+            fs.write_many({"ok.txt": b"ok", "../escape.txt": b"bad"})
+        assert fs.exists("ok.txt") is False
+        assert not (tmp_path / "escape.txt").exists()
+
     def test_remove(self, tmp_path):
         """Test removing a file."""
         fs = IsolatedFS(str(tmp_path))
@@ -353,6 +390,38 @@ class TestIsolatedListdir:
         assert "sub" in result
         assert os.path.join("sub", "b.txt") in result
 
+    def test_listdir_recursive_skips_symlinked_dirs(self, tmp_path):
+        """Test that recursive listing doesn't descend into symlinked dirs."""
+        fs = IsolatedFS(str(tmp_path))
+        fs.write("sub/b.txt", b"b")
+        fs.symlink("sub", "link")
+        result = fs.list("/", recursive=True)
+        assert result == sorted(["link", "sub", os.path.join("sub", "b.txt")])
+
+    def test_list_stat(self, tmp_path):
+        """Test that list_stat() pairs each name with its stat() result."""
+        fs = IsolatedFS(str(tmp_path))
+        fs.write("a.txt", b"abc")
+        fs.mkdir("sub")
+        fs.symlink("a.txt", "link")
+
+        entries = fs.list_stat("/")
+        assert [name for name, _ in entries] == ["a.txt", "link", "sub"]
+        for name, meta in entries:
+            assert meta == fs.stat(name)
+
+    def test_list_stat_skips_dangling_and_escaping_links(self, tmp_path):
+        """Test that links stat() can't follow are left out of list_stat()."""
+        root = tmp_path / "root"
+        root.mkdir()
+        (tmp_path / "secret.txt").write_text("secret")
+        (root / "a.txt").write_text("a")
+        (root / "escape").symlink_to(tmp_path / "secret.txt")
+        (root / "dangling").symlink_to(root / "missing.txt")
+        fs = IsolatedFS(str(root))
+
+        assert [name for name, _ in fs.list_stat("/")] == ["a.txt"]
+
     def test_list_nonexistent_raises(self, tmp_path):
         """Test listing a nonexistent directory raises FileNotFoundError."""
         fs = IsolatedFS(str(tmp_path))
@@ -365,6 +434,8 @@ class TestIsolatedListdir:
         fs.write("file.txt", b"data")
         with pytest.raises(NotADirectoryError):
             fs.list("file.txt")
+        with pytest.raises(NotADirectoryError):
+            fs.list_stat("file.txt")
 
 
 # ---------------------------------------------------------------------------
@@ -451,6 +522,16 @@ class TestIsolatedCwdAndPaths:
         resolved = fs.resolve_path("/top/level.txt")
         assert resolved == "/top/level.txt"
 
+    def test_resolve_path_relative_at_root(self, tmp_path):
+        """Test that relative paths at the root get a single leading slash."""
+        fs = IsolatedFS(str(tmp_path))
+        assert fs.resolve_path("file.txt") == "/file.txt"
+        assert fs.resolve_path("./a/../b") == "/b"
+        fs.mkdir("sub")
+        fs.chdir("sub")
+        fs.chdir("..")
+        assert fs.resolve_path("file.txt") == "/file.txt"
+
 
 # ---------------------------------------------------------------------------
 # Glob
@@ -493,6 +574,53 @@ class TestIsolatedGlob:
         fs = IsolatedFS(str(tmp_path))
         assert fs.glob("*.xyz") == []
 
+    def test_glob_literal(self, tmp_path):
+        """Test that a pattern without wildcards matches only that path."""
+        fs = IsolatedFS(str(tmp_path))
+        fs.write("src/package.json", b"{}")
+        assert fs.glob("src/package.json") == ["src/package.json"]
+        assert fs.glob("/src/package.json") == ["/src/package.json"]
+        assert fs.glob("src") == ["src"]
+        assert fs.glob("src/missing.json") == []
+
+    def test_glob_relative_to_cwd(self, tmp_path):
+        """Test that relative matches are returned relative to the CWD."""
+        fs = IsolatedFS(str(tmp_path))
+        fs.write("src/a.py", b"a")
+        fs.write("src/b.py", b"b")
+        fs.chdir("src")
+        assert fs.glob("*.py") == ["a.py", "b.py"]
+        assert fs.glob("a.py") == ["a.py"]
+        assert fs.glob("../src/*.py") == ["../src/a.py", "../src/b.py"]
+
+    def test_glob_nested_literal_prefix(self, tmp_path):
+        """Test a pattern with a literal directory prefix and wildcard tail."""
+        fs = IsolatedFS(str(tmp_path))
+        fs.write("src/deeply/nested/a.py", b"a")
+        fs.write("src/deeply/nested/b.txt", b"b")
+        fs.write("src/other/c.py", b"c")
+        assert fs.glob("src/deeply/nested/*.py") == ["src/deeply/nested/a.py"]
+        assert fs.glob("/src/*/*.py") == ["/src/other/c.py"]
+
+    def test_glob_prefix_escape_returns_empty(self, tmp_path):
+        """Test that a literal prefix climbing out of root matches nothing."""
+        root = tmp_path / "root"
+        fs = IsolatedFS(str(root))
+        assert fs.glob("../*") == []
+        assert fs.glob("/../*") == []
+
+    def test_glob_literal_escape_returns_empty(self, tmp_path):
+        """Test that a literal pattern climbing out of root matches nothing."""
+        root = tmp_path / "root"
+        (tmp_path / "secret.txt").write_bytes(b"secret")
+        fs = IsolatedFS(str(root))
+        fs.write("src/a.py", b"a")
+        assert fs.glob("../secret.txt") == []
+        assert fs.glob("/../secret.txt") == []
+        fs.chdir("src")
+        assert fs.glob("../../secret.txt") == []
+        assert fs.glob("../src/a.py") == ["../src/a.py"]
+
 
 # ---------------------------------------------------------------------------
 # Path validation
@@ -514,6 +642,38 @@ class TestIsolatedPathValidation:
         with pytest.raises(PermissionError):
             fs._validate_path("sub/../../secret")
 
+    def test_symlink_escape_raises(self, tmp_path):
+        """Test that a symlinked directory pointing outside root is rejected."""
+        root = tmp_path / "root"
+        outside = tmp_path / "outside"
+        root.mkdir()
+        outside.mkdir()
+        (outside / "secret.txt").write_text("secret")
+        os.symlink(outside, root / "link")
+        fs = IsolatedFS(str(root))
+        with pytest.raises(PermissionError):
+            fs._validate_path("link/secret.txt")
+        with pytest.raises(PermissionError):
+            fs.read("/link/secret.txt")
+
+    def test_sibling_with_root_prefix_rejected(self, tmp_path):
+        """Test that a sibling dir sharing root's name prefix is outside root."""
+        root = tmp_path / "data"
+        sibling = tmp_path / "data-other"
+        root.mkdir()
+        sibling.mkdir()
+        fs = IsolatedFS(str(root))
+        with pytest.raises(PermissionError):
+            fs._validate_path("../data-other/file.txt")
+
+    def test_host_path_inside_root_accepted(self, tmp_path):
+        """Test that an already-resolved host path inside root is used as is."""
+        fs = IsolatedFS(str(tmp_path))
+        fs.write("a/b.txt", b"x")
+        host = fs._validate_path("a/b.txt")
+        assert fs._validate_path(str(host)) == host
+        assert fs._validate_path(str(fs.root)) == fs.root
+
 
 # ---------------------------------------------------------------------------
 # list_detailed / listdir_detailed
@@ -546,6 +706,40 @@ class TestIsolatedListDetailed:
         assert "b.txt" in names
         assert "sub" in names
 
+    def test_list_detailed_recursive_paths(self, tmp_path):
+        """Test recursive list_detailed paths are root-relative and sorted."""
+        fs = IsolatedFS(str(tmp_path))
+        fs.write("b.txt", b"b")
+        fs.write("sub/deep/c.txt", b"cc")
+        result = fs.list_detailed("/", recursive=True)
+        assert [fi.path for fi in result] == [
+            "b.txt",
+            "sub",
+            os.path.join("sub", "deep"),
+            os.path.join("sub", "deep", "c.txt"),
+        ]
+        assert result[-1].size == 2
+        assert result[1].is_dir is True
+        assert result[1].size == 0
+
+    def test_iter_list_detailed(self, tmp_path):
+        """Test iter_list_detailed yields the same entries lazily."""
+        fs = IsolatedFS(str(tmp_path))
+        fs.write("a.txt", b"a")
+        fs.write("sub/b.txt", b"bb")
+        it = fs.iter_list_detailed("/", recursive=True)
+        assert isinstance(next(it), FileInfo)
+        assert sorted(fi.path for fi in fs.iter_list_detailed("/", True)) == [
+            fi.path for fi in fs.list_detailed("/", recursive=True)
+        ]
+
+    def test_iter_list_detailed_validates_eagerly(self, tmp_path):
+        """Test iter_list_detailed raises before iteration starts."""
+        fs = IsolatedFS(str(tmp_path))
+        fs.write("a.txt", b"a")
+        with pytest.raises(NotADirectoryError):
+            fs.iter_list_detailed("a.txt")
+
 
 # ---------------------------------------------------------------------------
 # Optional / OS-level methods
@@ -610,6 +804,26 @@ class TestIsolatedOptionalMethods:
         target_str = fs.readlink("link.txt")
         assert "target.txt" in target_str
 
+    def test_symlink_to_symlink_keeps_chain(self, tmp_path):
+        """Test a link to a link points at the link, not its final target."""
+        fs = IsolatedFS(str(tmp_path))
+        fs.write("target.txt", b"target data")
+        fs.symlink("target.txt", "first.txt")
+        fs.symlink("first.txt", "second.txt")
+        assert fs.readlink("second.txt").endswith("first.txt")
+        assert fs.read("second.txt") == b"target data"
+
+    def test_symlink_to_escaping_symlink_raises(self, tmp_path):
+        """Test symlink refuses a target link that leads outside root."""
+        root = tmp_path / "root"
+        root.mkdir()
+        (tmp_path / "secret.txt").write_text("secret")
+        os.symlink(tmp_path / "secret.txt", root / "out.txt")
+        fs = IsolatedFS(str(root))
+        with pytest.raises(PermissionError):
+            fs.symlink("out.txt", "chained.txt")
+        assert not fs.lexists("chained.txt")
+
     def test_readlink_blocks_escaping_relative_target(self, tmp_path):
         """Test readlink rejects relative symlinks that escape the sandbox."""
         fs = IsolatedFS(str(tmp_path))
@@ -649,6 +863,14 @@ class TestIsolatedOptionalMethods:
         assert fs.lexists("here.txt") is True
         assert fs.lexists("not_here.txt") is False
 
+    def test_lexists_dangling_symlink(self, tmp_path):
+        """Test lexists: True for a symlink whose target is missing."""
+        fs = IsolatedFS(str(tmp_path))
+        fs.symlink("missing.txt", "dangling.txt")
+        assert fs.exists("dangling.txt") is False
+        assert fs.lexists("dangling.txt") is True
+        assert fs.islink("dangling.txt") is True
+
     def test_samefile_same(self, tmp_path):
         """Test samefile returns True for the same path."""
         fs = IsolatedFS(str(tmp_path))
@@ -662,6 +884,18 @@ class TestIsolatedOptionalMethods:
         fs.write("two.txt", b"2")
         assert fs.samefile("one.txt", "two.txt") is False
 
+    def test_samefile_hard_link(self, tmp_path):
+        """Test samefile returns True for hard links to one file."""
+        fs = IsolatedFS(str(tmp_path))
+        fs.write("one.txt", b"1")
+        fs.link("one.txt", "alias.txt")
+        assert fs.samefile("one.txt", "alias.txt") is True
+
+    def test_samefile_nonexistent(self, tmp_path):
+        """Test samefile returns False for missing paths, like VirtualFS."""
+        fs = IsolatedFS(str(tmp_path))
+        assert fs.samefile("x.txt", "x.txt") is False
+
     def test_realpath(self, tmp_path):
         """Test realpath returns canonical virtual path."""
         fs = IsolatedFS(str(tmp_path))
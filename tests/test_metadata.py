@@ -1,6 +1,25 @@
 """Tests for VirtualFS file metadata tracking."""
 
-from monkeyfs import VirtualFS
+import dataclasses
+import json
+import os
+
+import pytest
+
+from monkeyfs import FileInfo, FileMetadata, VirtualFS, patch
+
+
+class CountingState(dict):
+    """Dict state that counts metadata writes."""
+
+    def __init__(self):
+        super().__init__()
+        self.metadata_writes = 0
+
+    def __setitem__(self, key, value):
+        if key == VirtualFS.METADATA_KEY:
+            self.metadata_writes += 1
+        super().__setitem__(key, value)
 
 
 class TestFileMetadata:
@@ -46,6 +65,79 @@ class TestFileMetadata:
         assert new_meta.created_at == original_meta.created_at  # Preserved
         assert new_meta.size == original_meta.size
 
+    def test_rename_persists_metadata_twice(self):
+        """Test that a file rename doesn't flush metadata more than needed."""
+        state = CountingState()
+        vfs = VirtualFS(state)
+        vfs.write("old.txt", b"content")
+        created = vfs.stat("old.txt").created_at
+
+        state.metadata_writes = 0
+        vfs.rename("old.txt", "new.txt")
+
+        assert state.metadata_writes == 2  # write dst, then drop src
+        reloaded = VirtualFS(dict(state))
+        assert reloaded.stat("new.txt").created_at == created
+        assert not reloaded.exists("old.txt")
+
+    def test_rename_onto_itself_keeps_file(self):
+        """Test that renaming a file to its own path leaves it in place."""
+        vfs = VirtualFS({})
+        vfs.write("dir/file.txt", b"content")
+        before = vfs.stat("dir/file.txt")
+
+        vfs.chdir("dir")
+        vfs.rename("file.txt", "/dir/file.txt")
+
+        assert vfs.read("/dir/file.txt") == b"content"
+        assert vfs.stat("/dir/file.txt") == before
+
+    def test_makedirs_persists_metadata_once(self):
+        """Test that makedirs flushes metadata once for the whole tree."""
+        state = CountingState()
+        vfs = VirtualFS(state)
+
+        vfs.makedirs("a/b/c/d")
+
+        assert state.metadata_writes == 1
+        reloaded = VirtualFS(dict(state))
+        assert reloaded.isdir("a/b/c/d")
+        assert reloaded.stat("a/b").is_dir
+
+    def test_metadata_survives_reload(self):
+        """Test that metadata round-trips through the backing state."""
+        state = {}
+        vfs = VirtualFS(state)
+        vfs.write("dir/file.txt", b"hello")
+        before = vfs.stat("dir/file.txt")
+
+        reloaded = VirtualFS(state)
+
+        assert reloaded.stat("dir/file.txt") == before
+        assert reloaded.stat("dir").is_dir
+
+    def test_legacy_metadata_format_loads(self):
+        """Test that state written in the per-field dict format still loads."""
+        state = {}
+        vfs = VirtualFS(state)
+        vfs.write("file.txt", b"hello")
+        state[VirtualFS.METADATA_KEY] = json.dumps(
+            {
+                "file.txt": {
+                    "size": 5,
+                    "created_at": "2024-01-01T00:00:00+00:00",
+                    "modified_at": "2024-01-02T00:00:00+00:00",
+                    "is_dir": False,
+                }
+            }
+        ).encode()
+
+        meta = VirtualFS(state).stat("file.txt")
+
+        assert meta.size == 5
+        assert meta.created_at == "2024-01-01T00:00:00+00:00"
+        assert meta.modified_at == "2024-01-02T00:00:00+00:00"
+
     def test_remove_deletes_metadata(self):
         """Test that removing a file deletes its metadata."""
         vfs = VirtualFS({})
@@ -161,6 +253,21 @@ class TestFileMetadata:
         assert file2.size == 2
         assert file2.path == "/dir/file2.txt"
 
+    def test_iter_list_detailed_matches_list_detailed(self):
+        """Test that iter_list_detailed yields what list_detailed returns."""
+        vfs = VirtualFS({})
+        vfs.write("a.txt", b"a")
+        vfs.write("dir/b.txt", b"bb")
+
+        it = vfs.iter_list_detailed("/", recursive=True)
+        assert next(it).path == "/a.txt"
+        assert [f.path for f in vfs.iter_list_detailed("/", recursive=True)] == [
+            f.path for f in vfs.list_detailed("/", recursive=True)
+        ]
+
+        with pytest.raises(FileNotFoundError):
+            vfs.iter_list_detailed("/missing")
+
     def test_utime_updates_modified_at(self):
         """Test that utime() updates modification time in metadata."""
         vfs = VirtualFS({})
@@ -201,3 +308,77 @@ class TestFileMetadata:
             assert False, "Should have raised FileNotFoundError"
         except FileNotFoundError:
             pass
+
+    def test_stat_times_parsed_from_iso(self):
+        """Test that st_*time properties reflect the ISO timestamps."""
+        meta = FileMetadata(
+            size=1,
+            created_at="2020-01-01T00:00:00+00:00",
+            modified_at="2021-01-01T00:00:00+00:00",
+        )
+
+        assert meta.st_ctime == 1577836800.0
+        assert meta.st_mtime == 1609459200.0
+        assert meta.st_atime == meta.st_mtime
+        # Repeated access returns the cached value
+        assert meta.st_mtime == 1609459200.0
+
+    def test_patched_stat_matches_metadata(self):
+        """Test that os.stat() under patch() mirrors the stored metadata."""
+        vfs = VirtualFS({})
+        vfs.write("a.txt", b"hello")
+        meta = vfs.stat("a.txt")
+
+        with patch(vfs):
+            first = os.stat("a.txt")
+            second = os.stat("a.txt")
+
+        assert first == second
+        assert first.st_size == meta.st_size == 5
+        assert first.st_mode == meta.st_mode
+        assert first.st_mtime == meta.st_mtime
+        # Caching the conversion doesn't affect equality or hashing
+        assert meta == FileMetadata(meta.size, meta.created_at, meta.modified_at)
+        assert hash(meta) == hash(
+            FileMetadata(meta.size, meta.created_at, meta.modified_at)
+        )
+
+    def test_stat_mode_reflects_is_dir(self):
+        """Test that st_mode distinguishes files from directories."""
+        assert FileMetadata(0, "", "").st_mode == 0o100644
+        assert FileMetadata(0, "", "", is_dir=True).st_mode == 0o040755
+        assert FileMetadata(0, "bad", "bad").st_mtime == 0.0
+
+    def test_metadata_is_frozen(self):
+        """Test that FileMetadata and FileInfo are immutable and slotted."""
+        meta = FileMetadata(size=1, created_at="", modified_at="")
+        info = FileInfo("a", "a", 1, "", "", False)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            meta.size = 2  # type: ignore[misc]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            info.path = "b"  # type: ignore[misc]
+        assert not hasattr(meta, "__dict__")
+        assert not hasattr(info, "__dict__")
+        assert hash(meta) == hash(FileMetadata(size=1, created_at="", modified_at=""))
+
+    def test_metadata_fields_exclude_caches(self):
+        """Test that derived-value caches are not part of the public fields."""
+        import copy
+        import pickle
+
+        names = [f.name for f in dataclasses.fields(FileMetadata)]
+        assert names == ["size", "created_at", "modified_at", "is_dir"]
+
+        ts = "2024-01-01T00:00:00+00:00"
+        meta = FileMetadata(5, ts, ts)
+        before = dataclasses.asdict(meta)
+        assert meta.st_mtime == 1704067200.0
+        meta._to_stat_result()
+        assert dataclasses.asdict(meta) == before
+        assert dataclasses.astuple(meta) == (5, ts, ts, False)
+
+        for clone in (pickle.loads(pickle.dumps(meta)), copy.copy(meta)):
+            assert clone == meta
+            assert clone.st_mode == 0o100644
+            assert clone.st_mtime == 1704067200.0
@@ -150,6 +150,14 @@ class TestMountFSDirectoryListing:
         assert not file_entry.is_dir
         assert file_entry.created_at is not None
 
+    def test_iter_list_detailed(self):
+        fs = MountFS(_make_base(), {"/chapters": _make_mount()})
+        entries = list(fs.iter_list_detailed("/", recursive=True))
+        assert [e.path for e in entries] == [
+            e.path for e in fs.list_detailed("/", recursive=True)
+        ]
+        assert "/chapters/summary.md" in [e.path for e in entries]
+
     def test_isdir_mount_point(self):
         fs = MountFS(_make_base(), {"/chapters": _make_mount()})
         assert fs.isdir("/chapters")
@@ -5,7 +5,7 @@ from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-from monkeyfs import VirtualFS, patch
+from monkeyfs import VirtualFS, current_fs, patch, suspend
 
 
 class TestPatchingBasics:
@@ -214,6 +214,30 @@ class TestContextIsolation:
         assert vfs_1.read("file.txt") == b"content 1"
         assert vfs_2.read("file.txt") == b"content 2"
 
+    def test_suspend_restores_active_fs(self):
+        """Test that suspend() clears the active fs and restores it on exit."""
+        vfs = VirtualFS({})
+        with patch(vfs):
+            with suspend():
+                assert current_fs.get() is None
+            assert current_fs.get() is vfs
+
+    def test_suspend_restores_on_exception(self):
+        """Test that suspend() restores the active fs when the block raises."""
+        vfs = VirtualFS({})
+        with patch(vfs):
+            with pytest.raises(RuntimeError):
+                with suspend():
+                    raise RuntimeError("boom")
+            assert current_fs.get() is vfs
+
+    def test_suspend_without_active_fs(self):
+        """Test that suspend() is a no-op when no fs is active."""
+        assert current_fs.get() is None
+        with suspend():
+            assert current_fs.get() is None
+        assert current_fs.get() is None
+
 
 class TestPatchingEdgeCases:
     """Test edge cases in patching."""
@@ -239,6 +263,69 @@ class TestPatchingEdgeCases:
             # Inner file should not be in outer VFS
             assert vfs_outer.exists("inner.txt") is False
 
+    def test_safe_path_prefix_with_dotdot_is_not_passthrough(self):
+        """Test that a path climbing out of a library dir is not passed through."""
+        stdlib_dir = os.path.dirname(os.__file__)
+        escape = stdlib_dir + "/.." * stdlib_dir.count("/") + "/escape.txt"
+        vfs = VirtualFS({})
+
+        with patch(vfs):
+            # Warm the passthrough check for a genuine library path
+            assert os.path.exists(os.__file__)
+            assert os.path.exists(escape) is False
+            with open(escape, "w") as f:
+                f.write("virtual")
+
+        assert vfs.exists("/escape.txt") is True
+
+    def test_safe_path_match_respects_component_boundary(self):
+        """Test that a sibling sharing a library dir's name prefix is not safe."""
+        import sys
+
+        from monkeyfs.patching.core import _is_safe_system_path
+
+        prefix = os.path.realpath(sys.prefix)
+
+        assert _is_safe_system_path(prefix) is True
+        assert _is_safe_system_path(os.path.join(prefix, "data.txt")) is True
+        assert _is_safe_system_path(prefix + "-evil/data.txt") is False
+
+    def test_safe_path_check_with_missing_top_level(self, monkeypatch):
+        """Test that paths under a missing top-level dir skip realpath()."""
+        from monkeyfs.patching import core
+
+        resolved = []
+        monkeypatch.setattr(core, "_resolve_for_safe_check", resolved.append)
+
+        assert core._is_safe_system_path("/monkeyfs-missing/a/b.txt") is False
+        assert resolved == []
+
+    def test_safe_path_check_missing_top_level_with_dotdot(self):
+        """Test that ".." after a missing top-level dir still resolves."""
+        from monkeyfs.patching.core import _is_safe_system_path
+
+        assert _is_safe_system_path(os.__file__) is True
+        assert _is_safe_system_path("/monkeyfs-missing/.." + os.__file__) is True
+
+    def test_lstat_safe_system_symlink_not_followed(self):
+        """Test that os.lstat on a library symlink reports the link itself."""
+        import stat
+        import sys
+
+        bin_dir = os.path.join(sys.prefix, "bin")
+        links = [
+            os.path.join(bin_dir, name)
+            for name in (os.listdir(bin_dir) if os.path.isdir(bin_dir) else [])
+            if os.path.islink(os.path.join(bin_dir, name))
+            and os.path.exists(os.path.join(bin_dir, name))
+        ]
+        if not links:
+            pytest.skip("no symlinks under sys.prefix/bin")
+
+        with patch(VirtualFS({})):
+            st = os.lstat(links[0])
+        assert stat.S_ISLNK(st.st_mode)
+
     def test_exception_in_context(self):
         """Test that VFS context is properly reset on exception."""
         vfs = VirtualFS({})
@@ -303,6 +390,19 @@ class TestPatchingEdgeCases:
             assert os.path.lexists("test.txt") is True
             assert os.path.lexists("nonexistent.txt") is False
 
+    def test_lexists_outside_context_keeps_dangling_symlinks(self, tmp_path):
+        """Test that os.path.lexists() outside a context doesn't follow links."""
+        link = tmp_path / "dangling"
+        link.symlink_to(tmp_path / "missing")
+
+        with patch(VirtualFS({})):
+            pass
+
+        # Patches stay installed; with no fs active, lexists is the real one
+        assert os.path.lexists(link) is True
+        with suspend():
+            assert os.path.lexists(link) is True
+
     def test_samefile_patched(self):
         """Test that os.path.samefile() is patched for VFS."""
         vfs = VirtualFS({})
@@ -437,6 +537,16 @@ class TestPartialProtocol:
             stat_result = os.stat("test.txt")
             assert stat_result.st_size == 7
 
+    def test_scandir_without_list_stat(self):
+        """Test that scandir falls back to per-entry stat() without list_stat."""
+        fs = self._make_minimal_fs()
+        with patch(fs):
+            with os.scandir("/") as it:
+                entries = list(it)
+        assert [e.name for e in entries] == ["test.txt"]
+        assert entries[0].is_file()
+        assert entries[0].stat().st_size == 7
+
     def test_rmdir_raises_not_implemented(self):
         fs = self._make_minimal_fs()
         with patch(fs):
@@ -671,22 +781,50 @@ class TestIsolatedPatching:
             assert os.path.samefile("test.txt", "test.txt") is True
 
 
-class TestShutilFlagDisabling:
-    """Test that shutil optimization flags are disabled during patch()."""
+class TestShutilFastCopyWrapping:
+    """Test shutil's fd-based rmtree and kernel fast-copy paths under patch()."""
 
-    def test_flags_disabled_inside_context(self):
-        """shutil optimization flags should be False inside patch()."""
+    def test_fastcopy_flags_preserved_inside_context(self):
+        """fd-based rmtree is disabled inside patch(); fast copies are not."""
         import shutil
 
+        fast_copy_flags = {
+            flag: getattr(shutil, flag)
+            for flag in ("_HAS_FCOPYFILE", "_USE_CP_SENDFILE")
+            if hasattr(shutil, flag)
+        }
         vfs = VirtualFS({})
 
         with patch(vfs):
             if hasattr(shutil, "_use_fd_functions"):
                 assert shutil._use_fd_functions is False
-            if hasattr(shutil, "_HAS_FCOPYFILE"):
-                assert shutil._HAS_FCOPYFILE is False
-            if hasattr(shutil, "_USE_CP_SENDFILE"):
-                assert shutil._USE_CP_SENDFILE is False
+            for flag, value in fast_copy_flags.items():
+                assert getattr(shutil, flag) == value
+
+    @pytest.mark.skipif(
+        not hasattr(__import__("shutil"), "_fastcopy_sendfile"),
+        reason="no sendfile fast copy helper",
+    )
+    def test_fastcopy_sendfile_gives_up_on_virtual_fd(self, tmp_path, monkeypatch):
+        """A virtual fd falls back to read/write instead of reaching sendfile."""
+        import shutil
+
+        def fail_sendfile(*args):
+            raise AssertionError("virtual fd reached os.sendfile")
+
+        monkeypatch.setattr(os, "sendfile", fail_sendfile, raising=False)
+        vfs = VirtualFS({})
+        vfs.write("src.txt", b"copy me")
+
+        # A real destination fd, so only the virtual source can trigger the fallback
+        with open(tmp_path / "dst.txt", "wb") as fdst, patch(vfs):
+            fd = os.open("src.txt", os.O_RDONLY)
+            with os.fdopen(fd, "rb") as fsrc:
+                with pytest.raises(shutil._GiveupOnFastCopy):
+                    shutil._fastcopy_sendfile(fsrc, fdst)
+            shutil.copyfile("src.txt", "copy.txt")
+
+        assert vfs.read("copy.txt") == b"copy me"
 
     def test_flags_restored_after_context(self):
         """shutil optimization flags should be restored after patch()."""
@@ -742,6 +880,41 @@ class TestShutilFlagDisabling:
 
         assert vfs.read("dst.txt") == b"copy me"
 
+    @pytest.mark.skipif(
+        not getattr(__import__("shutil"), "_USE_CP_SENDFILE", False),
+        reason="sendfile fast copy not available",
+    )
+    def test_shutil_copyfile_sendfile_between_real_files(self, tmp_path, monkeypatch):
+        """IsolatedFS files keep the kernel copy; virtual fds give up on it."""
+        import shutil
+
+        from monkeyfs import IsolatedFS
+
+        calls = []
+        real_sendfile = os.sendfile
+
+        def counting_sendfile(*args):
+            calls.append(args[:2])
+            return real_sendfile(*args)
+
+        monkeypatch.setattr(os, "sendfile", counting_sendfile)
+        (tmp_path / "src.txt").write_bytes(b"copy me")
+
+        with patch(IsolatedFS(str(tmp_path))):
+            shutil.copyfile("src.txt", "dst.txt")
+        assert (tmp_path / "dst.txt").read_bytes() == b"copy me"
+        assert calls
+        kernel_copies = len(calls)
+
+        vfs = VirtualFS({})
+        vfs.write("src.txt", b"copy me")
+        with patch(vfs):
+            fd = os.open("src.txt", os.O_RDONLY)
+            with os.fdopen(fd, "rb") as fsrc, open("dst.txt", "wb") as fdst:
+                with pytest.raises(shutil._GiveupOnFastCopy):
+                    shutil._fastcopy_sendfile(fsrc, fdst)
+        assert len(calls) == kernel_copies
+
     def test_shutil_copy_works_with_chmod(self):
         """shutil.copy (includes chmod) should work with VirtualFS."""
         import shutil
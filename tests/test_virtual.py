@@ -48,6 +48,21 @@ class TestVirtualFSBasics:
         files = vfs.list("data")
         assert sorted(files) == ["file1.csv", "file2.csv"]
 
+    def test_list_stat_matches_stat(self):
+        """Test that list_stat() pairs each name with its stat() result."""
+        vfs = VirtualFS({})
+        vfs.write("data/file1.csv", b"a,b,c")
+        vfs.mkdir("data/empty")
+        vfs.write_many({"data/implicit/x.txt": b"x"})
+
+        entries = vfs.list_stat("data")
+        assert [name for name, _ in entries] == ["empty", "file1.csv", "implicit"]
+        stats = dict(entries)
+        assert stats["file1.csv"] == vfs.stat("data/file1.csv")
+        assert stats["empty"] == vfs.stat("data/empty")
+        # Implicit directories have no stored timestamps
+        assert stats["implicit"].is_dir is True
+
     def test_list_nonexistent_raises(self):
         """Test listing a nonexistent directory raises FileNotFoundError."""
         vfs = VirtualFS({})